@@ -114,7 +114,7 @@ def register_routes(app, cache, no_api_doctor, deepseek_api_key, legacy_news_man
                     if cached:
                         return cached
                 try:
-                    status = no_api_doctor.collect_status()
+                    status = no_api_doctor.collect_status(force_refresh=force_refresh)
                     cache.set(cache_key, status)
                     return status
                 except Exception as exc:  # pragma: no cover - optional tool
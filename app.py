@@ -240,7 +240,7 @@ def get_no_api_health_snapshot(force_refresh: bool = False):
         return None
         
     try:
-        status = _no_api_doctor.collect_status()
+        status = _no_api_doctor.collect_status(force_refresh=force_refresh)
         global_cache.set(cache_key, status)
         return status
     except Exception as exc:  # pragma: no cover - network dependent
@@ -7,8 +7,14 @@ import json
 from datetime import datetime, timezone
 from typing import Dict, Optional
 
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
+# Selectors compiled once at import rather than resolved through soup.select* per call
+_SEL_OG_TITLE = sv.compile('meta[property="og:title"]')
+_SEL_OG_DESC = sv.compile('meta[property="og:description"], meta[name="description"]')
+_SEL_LD_JSON = sv.compile('script[type="application/ld+json"]')
+
 
 def parse_metadata(html: str) -> Dict[str, Optional[str]]:
     soup = BeautifulSoup(html, "lxml")
@@ -19,14 +25,14 @@ def parse_metadata(html: str) -> Dict[str, Optional[str]]:
         "published_at": None,
     }
 
-    og_title = soup.select_one('meta[property="og:title"]')
+    og_title = _SEL_OG_TITLE.select_one(soup)
     if og_title and og_title.has_attr("content"):
         data["title"] = og_title["content"].strip()
-    og_desc = soup.select_one('meta[property="og:description"], meta[name="description"]')
+    og_desc = _SEL_OG_DESC.select_one(soup)
     if og_desc and og_desc.has_attr("content"):
         data["summary"] = og_desc["content"].strip()
 
-    for tag in soup.select('script[type="application/ld+json"]'):
+    for tag in _SEL_LD_JSON.select(soup):
         try:
             payload = json.loads(tag.string or "{}")
         except json.JSONDecodeError:
@@ -4,10 +4,15 @@ Deduplication helpers for crawler outputs.
 from __future__ import annotations
 
 import hashlib
-from typing import Iterable, List, Sequence, Tuple, TypeVar
+import re
+from collections import defaultdict
+from typing import Callable, Dict, FrozenSet, Iterable, List, Sequence, Tuple, TypeVar
 
 T = TypeVar("T")
 
+_NON_WORD = re.compile(r"[\W_]+")
+_TRACKING_PARAM = re.compile(r"(?:^|(?<=&))utm_[^&]*(?:&|$)")
+
 
 def make_digest(parts: Sequence[str]) -> str:
     joined = "|".join(part or "" for part in parts)
@@ -25,3 +30,57 @@ def dedupe_by_key(items: Iterable[T], key_fn) -> List[T]:
         result.append(item)
     return result
 
+
+def canonical_url(url: str) -> str:
+    """Normalise a URL for exact dedupe: drop the fragment, ``utm_*`` params and trailing slashes."""
+    if "#" not in url and "?" not in url and not url.endswith("/"):
+        return url
+    base, sep, query = url.partition("#")[0].partition("?")
+    base = base.rstrip("/")
+    if sep:
+        query = _TRACKING_PARAM.sub("", query).rstrip("&")
+        if query:
+            return f"{base}?{query}"
+    return base
+
+
+def _shingles(text: str, size: int) -> FrozenSet[str]:
+    normalized = _NON_WORD.sub(" ", (text or "").lower()).strip()
+    if len(normalized) <= size:
+        return frozenset([normalized]) if normalized else frozenset()
+    return frozenset(normalized[i : i + size] for i in range(len(normalized) - size + 1))
+
+
+def dedupe_near_duplicates(
+    items: Iterable[T],
+    text_fn: Callable[[T], str],
+    threshold: float = 0.8,
+    shingle_size: int = 5,
+) -> List[T]:
+    """
+    Drop items whose text is a near-duplicate (character-shingle Jaccard >= threshold)
+    of an earlier item. Candidates come from an inverted shingle index, so only items
+    sharing at least one shingle are compared.
+    """
+    kept: List[T] = []
+    kept_shingles: List[FrozenSet[str]] = []
+    index: Dict[str, List[int]] = defaultdict(list)
+    for item in items:
+        shingles = _shingles(text_fn(item), shingle_size)
+        if shingles:
+            overlaps: Dict[int, int] = defaultdict(int)
+            for shingle in shingles:
+                for idx in index.get(shingle, ()):
+                    overlaps[idx] += 1
+            size = len(shingles)
+            if any(
+                shared / (size + len(kept_shingles[idx]) - shared) >= threshold
+                for idx, shared in overlaps.items()
+            ):
+                continue
+            position = len(kept)
+            for shingle in shingles:
+                index[shingle].append(position)
+        kept.append(item)
+        kept_shingles.append(shingles)
+    return kept
@@ -121,7 +121,7 @@ def get_no_api_health_snapshot(force_refresh: bool = False) -> Optional[Dict[str
         if cached:
             return cached
     try:
-        status = _no_api_doctor.collect_status()
+        status = _no_api_doctor.collect_status(force_refresh=force_refresh)
         global_cache.set(cache_key, status)
         return status
     except Exception as exc:  # pragma: no cover - network dependent
@@ -11,6 +11,8 @@ from news.pipeline import NewsPipeline
 from news.settings import NewsSettings, load_settings
 from news.status import build_status
 
+# Fixed at import: the shared pipeline cache below is built from it. Code that needs
+# env changes picked up later should call news.settings.load_settings() instead.
 SETTINGS: NewsSettings = load_settings()
 _pipeline = NewsPipeline()
 _cache = PipelineCache(
@@ -12,6 +12,11 @@ from news.models import FetchCriteria, HealthStatus, NewsItem
 
 
 class SourceAdapter(Protocol):
+    """
+    Adapters may also define ``async def fetch_async(criteria, *, now)`` with the same
+    return contract; the pipeline awaits it instead of running ``fetch`` in a worker thread.
+    """
+
     name: str
 
     def fetch(self, criteria: FetchCriteria, *, now: datetime) -> Tuple[List[NewsItem], HealthStatus]:
@@ -70,7 +70,7 @@ class RssAdapter:
                     if article.published_at and article.published_at > initial_last_fetch_time:
                         new_articles.append(article)
                 
-                logger.debug(f"Found {len(new_articles)} new articles in {self.source_name} feed {feed}")
+                logger.debug("Found %d new articles in %s feed %s", len(new_articles), self.source_name, feed)
                 
                 for article in new_articles[: self.limit_per_feed]:
                     collected.append(
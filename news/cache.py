@@ -8,13 +8,24 @@ Inspired by BettaFish's lightweight/extensible philosophy, this cache now:
 """
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
+import os
+import tempfile
 import threading
 import time
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib json is the fallback
+    orjson = None
 
 from news.models import ContentType, HealthStatus, Market, NewsItem, PipelineResult
 
@@ -23,33 +34,56 @@ logger = logging.getLogger(__name__)
 CACHE_DIR = Path(__file__).resolve().parent
 DEFAULT_CACHE_FILE = CACHE_DIR / ".pipeline_cache.json"
 
+# Value -> member tables so hydration skips Enum.__call__ for every cached item
+_CONTENT_TYPES: Dict[str, ContentType] = {member.value: member for member in ContentType}
+_MARKETS: Dict[str, Market] = {member.value: member for member in Market}
+
 
 class PipelineCache:
-    def __init__(self, ttl_seconds: int = 300, storage_path: Optional[Path] = None, max_entries: int = 4, max_memory_entries: int = 10) -> None:
+    def __init__(
+        self,
+        ttl_seconds: int = 300,
+        storage_path: Optional[Path] = None,
+        max_entries: int = 4,
+        max_memory_entries: int = 10,
+        thread_safe: bool = True,
+    ) -> None:
         self.ttl_seconds = ttl_seconds
         self.storage_path = storage_path or DEFAULT_CACHE_FILE
         self.max_entries = max_entries
         self.max_memory_entries = max_memory_entries
-        self._lock = threading.Lock()
-        self._memory: Dict[str, Tuple[PipelineResult, float]] = {}
+        # Single-threaded callers (tests, one-shot scripts) can skip locking entirely
+        self._lock = threading.Lock() if thread_safe else contextlib.nullcontext()
+        # Serialises load-prune-write of the disk file so concurrent sets don't drop each other's entries
+        self._disk_lock = threading.Lock() if thread_safe else contextlib.nullcontext()
+        # LRU order: least recently used first, so eviction is popitem(last=False)
+        self._memory: OrderedDict[str, Tuple[PipelineResult, float]] = OrderedDict()
+        # Parsed disk payload stamped with the file's (mtime_ns, size); avoids re-parsing unchanged files
+        self._disk_memo: Optional[Tuple[Tuple[int, int], Dict[str, Dict[str, object]]]] = None
 
-    def _key(self, markets: List[str], limit: int) -> str:
-        # Pre-sort markets for consistent key generation
-        return f"{','.join(sorted(markets))}:{limit}"
+    def _key(self, markets: Sequence[str], limit: int) -> str:
+        return _make_key(tuple(markets), limit)
 
-    def get(self, markets: List[str], limit: int) -> Optional[PipelineResult]:
+    def get(self, markets: Sequence[str], limit: int) -> Optional[PipelineResult]:
         key = self._key(markets, limit)
         now = time.time()
         
-        # First check memory cache
-        with self._lock:
-            entry = self._memory.get(key)
-            if entry:
-                result, ts = entry
-                if now - ts < self.ttl_seconds:
-                    return result
-                # Remove expired entry from memory
-                del self._memory[key]
+        # First check memory cache. Reads are lock-free: a single dict lookup is atomic,
+        # and writers only ever add or evict entries while holding the lock.
+        entry = self._memory.get(key)
+        if entry:
+            result, ts = entry
+            if now - ts < self.ttl_seconds:
+                try:
+                    # Single C-level call, atomic under the GIL; a concurrent eviction just raises
+                    self._memory.move_to_end(key)
+                except KeyError:
+                    pass
+                return result
+            # Remove expired entry from memory (unless a writer already replaced it)
+            with self._lock:
+                if self._memory.get(key) is entry:
+                    del self._memory[key]
 
         # Then check disk cache if memory cache miss
         disk_entries = self._load_disk_entries()
@@ -65,33 +99,36 @@ class PipelineCache:
                     # Cache in memory for faster access next time
                     with self._lock:
                         self._memory[key] = (result, now)
+                        self._memory.move_to_end(key)
                         self._prune_memory(now)
                     return result
                 except Exception as exc:  # pragma: no cover - defensive
                     logger.debug("Failed to hydrate cache entry %s: %s", key, exc)
         return None
 
-    def set(self, markets: List[str], limit: int, result: PipelineResult) -> None:
+    def set(self, markets: Sequence[str], limit: int, result: PipelineResult) -> None:
         key = self._key(markets, limit)
         now = time.time()
         
         # Update memory cache
         with self._lock:
             self._memory[key] = (result, now)
+            self._memory.move_to_end(key)
             self._prune_memory(now)
 
         # Update disk cache
+        # Dataclasses are serialized as-is by the encoder (see _dumps)
         entry = {
-            "generated_at": result.generated_at.isoformat(),
-            "items": [_item_to_dict(item) for item in result.items],
-            "health": [_health_to_dict(h) for h in result.health],
+            "generated_at": result.generated_at,
+            "items": result.items,
+            "health": result.health,
             "ts": now,
         }
         try:
-            entries = self._load_disk_entries()
-            entries[key] = entry
-            entries = self._prune_entries(entries, now)
-            self._write_disk_entries(entries)
+            with self._disk_lock:
+                entries = self._prune_entries(self._load_disk_entries(), key, now)
+                entries[key] = entry
+                self._write_disk_entries(entries)
         except Exception as exc:  # pragma: no cover - defensive
             logger.debug("Persisting cache failed: %s", exc)
 
@@ -99,20 +136,14 @@ class PipelineCache:
         """Return a lightweight view for health endpoints without exposing payload content."""
         now = time.time()
         
-        # Get memory entries
+        # Copy memory entries in one shot; expired ones are left for get to drop
         with self._lock:
-            memory_entries = []
-            for key, (result, ts) in list(self._memory.items()):
-                age = now - ts
-                if age < self.ttl_seconds:
-                    memory_entries.append({
-                        "key": key, 
-                        "age_seconds": round(age, 2), 
-                        "items": len(result.items)
-                    })
-                else:
-                    # Remove expired entries during snapshot
-                    del self._memory[key]
+            memory = list(self._memory.items())
+        memory_entries = [
+            {"key": key, "age_seconds": round(now - ts, 2), "items": len(result.items)}
+            for key, (result, ts) in memory
+            if now - ts < self.ttl_seconds
+        ]
 
         # Get disk entries
         disk_entries = []
@@ -135,91 +166,94 @@ class PipelineCache:
         }
 
     def _prune_memory(self, now: float) -> None:
-        """Prune expired and excess entries from memory cache."""
-        # Filter out expired entries
-        valid_entries = [(key, entry) for key, entry in self._memory.items() 
-                        if now - entry[1] < self.ttl_seconds]
-        
-        # If still too many entries, keep only the most recent ones
-        if len(valid_entries) > self.max_memory_entries:
-            # Sort by timestamp descending
-            valid_entries.sort(key=lambda x: x[1][1], reverse=True)
-            # Keep only the most recent entries
-            valid_entries = valid_entries[:self.max_memory_entries]
-            
-            # Rebuild memory cache
-            self._memory = {key: entry for key, entry in valid_entries}
-        else:
-            # Just update the memory cache with valid entries
-            self._memory = {key: entry for key, entry in valid_entries}
-
-    def _prune_entries(self, entries: Dict[str, Dict[str, object]], now: float) -> Dict[str, Dict[str, object]]:
-        """Prune expired and excess entries from disk cache."""
-        # Filter out expired entries
-        filtered = {
-            key: payload for key, payload in entries.items() 
-            if now - payload.get("ts", 0) < self.ttl_seconds
+        """Evict least recently used entries beyond ``max_memory_entries``; expired ones drop on ``get``."""
+        memory = self._memory
+        while len(memory) > self.max_memory_entries:
+            memory.popitem(last=False)
+
+    def _prune_entries(
+        self, entries: Dict[str, Dict[str, object]], key: str, now: float
+    ) -> Dict[str, Dict[str, object]]:
+        """Copy live disk entries other than ``key``, leaving room to append ``key`` as the newest."""
+        # Entries are persisted oldest-first (each write appends), so the head is the eviction candidate
+        pruned = {
+            other: payload for other, payload in entries.items()
+            if other != key and now - payload.get("ts", 0) < self.ttl_seconds
         }
-        
-        # If still too many entries, keep only the most recent ones
-        if len(filtered) > self.max_entries:
-            # Sort by timestamp descending
-            sorted_entries = sorted(filtered.items(), 
-                                  key=lambda kv: kv[1].get("ts", 0), 
-                                  reverse=True)
-            # Keep only the most recent entries
-            return dict(sorted_entries[:self.max_entries])
-        
-        return filtered
+        excess = len(pruned) - (self.max_entries - 1)
+        if excess > 0:
+            for stale in list(pruned)[:excess]:
+                del pruned[stale]
+        return pruned
 
     def _load_disk_entries(self) -> Dict[str, Dict[str, object]]:
-        if not self.storage_path.exists():
+        """Return parsed disk entries; callers must treat the result as read-only."""
+        try:
+            stat = self.storage_path.stat()
+        except OSError:
             return {}
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        memo = self._disk_memo
+        if memo is not None and memo[0] == stamp:
+            return memo[1]
         try:
-            blob = json.loads(self.storage_path.read_text(encoding="utf-8"))
+            blob = _loads(self.storage_path.read_bytes())
         except Exception:
             return {}
 
         # Backward compatibility: old format stored a single entry
         if "entries" not in blob:
-            if blob.get("key"):
-                return {blob["key"]: blob}
-            return {}
-
-        return blob.get("entries", {})
+            entries = {blob["key"]: blob} if blob.get("key") else {}
+        else:
+            entries = blob.get("entries", {})
+        self._disk_memo = (stamp, entries)
+        return entries
 
     def _write_disk_entries(self, entries: Dict[str, Dict[str, object]]) -> None:
         payload = {"entries": entries, "version": 2}
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-        self.storage_path.write_text(json.dumps(payload, default=str), encoding="utf-8")
-
-
-def _item_to_dict(item: NewsItem) -> Dict[str, object]:
-    return {
-        "title": item.title,
-        "description": item.description,
-        "url": item.url,
-        "source": item.source,
-        "content_type": item.content_type.value,
-        "market": item.market.value,
-        "published_at": item.published_at.isoformat() if item.published_at else None,
-        "metadata": item.metadata,
-        "topics": item.topics,
-        "relevance_score": item.relevance_score,
-        "semantic_similarity": item.semantic_similarity,
-    }
-
-
-def _health_to_dict(status: HealthStatus) -> Dict[str, object]:
-    return {
-        "name": status.name,
-        "healthy": status.healthy,
-        "last_error": status.last_error,
-        "last_success": status.last_success.isoformat() if status.last_success else None,
-        "items_last_fetch": status.items_last_fetch,
-        "latency_ms": status.latency_ms,
-        "extra": status.extra,
-    }
+        # Write to a uniquely named sibling temp file and rename, so readers never see a
+        # truncated payload and concurrent writers (other threads/processes) never share one
+        with tempfile.NamedTemporaryFile(
+            dir=self.storage_path.parent, prefix=f"{self.storage_path.name}.", suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(_dumps(payload))
+        try:
+            os.replace(tmp.name, self.storage_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp.name)
+            raise
+        # The in-memory payload still holds dataclasses; force the next read to parse the file
+        self._disk_memo = None
+
+
+@lru_cache(maxsize=128)
+def _make_key(markets: Tuple[str, ...], limit: int) -> str:
+    # Pre-sort markets for consistent key generation; memoized since callers reuse the same combos
+    return f"{','.join(sorted(markets))}:{limit}"
+
+
+def _json_default(value: object) -> object:
+    if is_dataclass(value):
+        # Mirror orjson: underscore-prefixed fields are internal and not persisted
+        return {f.name: getattr(value, f.name) for f in fields(value) if not f.name.startswith("_")}
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _dumps(payload: Dict[str, object]) -> bytes:
+    """Encode the cache payload; orjson handles dataclasses/datetimes/enums natively."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str)
+    return json.dumps(payload, default=_json_default).encode("utf-8")
+
+
+def _loads(data: bytes) -> Dict[str, object]:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def _dict_to_item(data: Dict[str, object]) -> NewsItem:
@@ -230,13 +264,16 @@ def _dict_to_item(data: Dict[str, object]) -> NewsItem:
         description=data.get("description") or "",
         url=data.get("url") or "",
         source=data.get("source") or "",
-        content_type=ContentType(data.get("content_type", ContentType.FINANCIAL_NEWS)),
-        market=Market(data.get("market", Market.GLOBAL)),
+        content_type=_CONTENT_TYPES.get(data.get("content_type"), ContentType.FINANCIAL_NEWS),
+        market=_MARKETS.get(data.get("market"), Market.GLOBAL),
         published_at=dt,
         metadata=data.get("metadata") or {},
         topics=data.get("topics") or [],
         relevance_score=data.get("relevance_score"),
         semantic_similarity=data.get("semantic_similarity"),
+        sentiment_score=data.get("sentiment_score"),
+        sentiment_label=data.get("sentiment_label"),
+        sentiment_dimensions=data.get("sentiment_dimensions") or {},
     )
 
 
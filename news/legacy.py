@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional
 
 from news import SETTINGS, get_health_snapshot, get_news
 from news.models import ContentType, Market, NewsItem
+from news.status import health_to_dict
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +34,10 @@ class NewsSourceManagerV2:
             logger.error("News pipeline failed: %s", exc)
             return []
 
-        self._health_cache = [status.__dict__ for status in result.health]
-        return [_news_item_to_dict(item) for item in result.items]
+        self._health_cache = [health_to_dict(status) for status in result.health]
+        # One timestamp per fetch: every item in a result shares the same fetch time
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        return [_news_item_to_dict(item, fetched_at) for item in result.items]
 
     def get_health_snapshot(self) -> Dict[str, Any]:
         health = get_health_snapshot()
@@ -52,18 +55,19 @@ class NewsSourceManagerV2:
         return payload
 
 
-def _news_item_to_dict(item: NewsItem) -> Dict[str, Any]:
+def _news_item_to_dict(item: NewsItem, fetched_at: str) -> Dict[str, Any]:
+    published_at = item.published_at
     return {
         "title": item.title,
         "description": item.description,
         "url": item.url,
         "source": item.source,
         "market": item.market.value,
-        "publishedAt": item.published_at.isoformat() if item.published_at else None,
+        "publishedAt": published_at.isoformat() if published_at else None,
         "contentType": item.content_type.value,
         "relevance_score": item.relevance_score,
         "semantic_similarity": item.semantic_similarity,
         "topics": item.topics,
         "metadata": item.metadata,
-        "fetchedAt": datetime.now(timezone.utc).isoformat(),
+        "fetchedAt": fetched_at,
     }
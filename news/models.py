@@ -6,7 +6,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
 
 class Market(str, Enum):
@@ -20,6 +20,40 @@ class Market(str, Enum):
     AUSTRALIA = "australia"
     CRYPTO = "crypto"
 
+    @classmethod
+    def parse_many(
+        cls,
+        raw: Union[str, Iterable[Union["Market", str]], None],
+        on_unknown: Optional[Callable[[object], None]] = None,
+    ) -> List["Market"]:
+        """
+        Resolve a comma-separated string or an iterable of tokens/enums to markets.
+
+        Tokens are matched case-insensitively; unknown ones are skipped and passed to
+        ``on_unknown`` so callers can log them in their own words.
+        """
+        if not raw:
+            return []
+        tokens = raw.split(",") if isinstance(raw, str) else raw
+        markets: List[Market] = []
+        for token in tokens:
+            if isinstance(token, Market):
+                markets.append(token)
+                continue
+            value = str(token).strip().lower()
+            if not value:
+                continue
+            market = _MARKET_BY_VALUE.get(value)
+            if market is None:
+                if on_unknown is not None:
+                    on_unknown(token)
+                continue
+            markets.append(market)
+        return markets
+
+
+_MARKET_BY_VALUE: Dict[str, Market] = {member.value: member for member in Market}
+
 
 class ContentType(str, Enum):
     FINANCIAL_NEWS = "financial-news"
@@ -27,7 +61,7 @@ class ContentType(str, Enum):
     FALLBACK = "fallback"
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsItem:
     """
     Normalized representation of an article/post across all upstream sources.
@@ -47,9 +81,18 @@ class NewsItem:
     sentiment_score: Optional[float] = None
     sentiment_label: Optional[str] = None
     sentiment_dimensions: Dict[str, float] = field(default_factory=dict)
+    # Lazily computed by text_lower(); private so it is neither compared nor serialized
+    _text_lower: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def text_lower(self) -> str:
+        """Lowercased ``title + " " + description``, computed once and reused across stages."""
+        text = self._text_lower
+        if text is None:
+            text = self._text_lower = " ".join((self.title, self.description)).lower()
+        return text
 
 
-@dataclass
+@dataclass(slots=True)
 class FetchCriteria:
     markets: List[Market]
     limit: int = 30
@@ -58,7 +101,7 @@ class FetchCriteria:
     include_financial: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthStatus:
     name: str
     healthy: bool
@@ -69,7 +112,7 @@ class HealthStatus:
     extra: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
     items: List[NewsItem]
     generated_at: datetime
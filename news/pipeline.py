@@ -3,19 +3,18 @@ High-level orchestration for the redesigned news pipeline.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
-from crawler.pipelines.dedupe import dedupe_by_key
+from crawler.pipelines.dedupe import canonical_url, dedupe_near_duplicates
 
 from news.adapters.base import AdapterRegistry
-from news.adapters.google_news import GoogleNewsRssAdapter
-from news.adapters.news_service import NewsServiceAdapter
-from news.adapters.rss import RssAdapter
-from news.adapters.social import SocialAdapter
-from news.adapters.yahoo_finance import YahooFinanceRssAdapter
 from news.cache import PipelineCache
 from news.config_loader import load_sources_config
 from news.models import ContentType, FetchCriteria, HealthStatus, Market, NewsItem, PipelineResult
@@ -23,6 +22,14 @@ from news.scoring import SemanticScorer
 from news.sentiment import SentimentAnalyzer
 from news.scheduler import NewsScheduler
 
+# Concrete adapters (and their feedparser/HTTP stacks) are imported only when configured
+if TYPE_CHECKING:  # pragma: no cover
+    from news.adapters.google_news import GoogleNewsRssAdapter
+    from news.adapters.news_service import NewsServiceAdapter
+    from news.adapters.rss import RssAdapter
+    from news.adapters.social import SocialAdapter
+    from news.adapters.yahoo_finance import YahooFinanceRssAdapter
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_NEWS_SOURCES = {
@@ -44,6 +51,31 @@ class NewsPipeline:
         self.config = load_sources_config()
         self.adapters = self._build_adapters()
         self._health: Dict[str, HealthStatus] = {}
+        # Worker pool shared by all runs; created lazily on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def adapters(self) -> List[object]:
+        return self._adapters
+
+    @adapters.setter
+    def adapters(self, adapters: Iterable[object]) -> None:
+        # Index adapters by the market they serve once, instead of filtering on every run.
+        # Adapters without a Market (multi-market services, custom adapters) go under None.
+        self._adapters = list(adapters)
+        by_market: Dict[Optional[Market], List[object]] = {}
+        for adapter in self._adapters:
+            market = getattr(adapter, "market", None)
+            by_market.setdefault(market if isinstance(market, Market) else None, []).append(adapter)
+        self._adapters_by_market = by_market
+
+    def _adapters_for(self, markets: Iterable[Market]) -> List[object]:
+        relevant: Dict[int, object] = {}
+        for market in (None, *markets):
+            for adapter in self._adapters_by_market.get(market, ()):
+                relevant[id(adapter)] = adapter
+        return list(relevant.values())
 
     def _build_adapters(self):
         """Build all configured adapters for the news pipeline.
@@ -64,6 +96,10 @@ class NewsPipeline:
     def _configure_google_rss(self):
         adapters = []
         google_section = self.config.get("google_news_rss", {})
+        if not google_section:
+            return adapters
+        from news.adapters.google_news import GoogleNewsRssAdapter
+
         for name, cfg in google_section.items():
             queries = cfg.get("queries") or []
             if isinstance(cfg.get("query"), str):
@@ -101,12 +137,11 @@ class NewsPipeline:
             or self.config.get("traditional_media", {}).get("news_api_key")
         )
         # Allow env overrides
-        import os
-
         api_key = os.getenv("NEWS_SERVICE_API_KEY") or os.getenv("NEWSAPI_API_KEY") or api_key
         if not api_key:
             logger.info("News service adapter disabled (missing API key).")
             return []
+        from news.adapters.news_service import NewsServiceAdapter
 
         endpoint = "https://newsapi.org/v2/everything"
         traditional = self.config.get("traditional_media", {})
@@ -130,6 +165,10 @@ class NewsPipeline:
     def _configure_rss(self):
         adapters = []
         rss_section = self.config.get("rss_feeds") or self.config.get("traditional_media", {})
+        if not rss_section:
+            return adapters
+        from news.adapters.rss import RssAdapter
+
         for name, cfg in rss_section.items():
             feeds = cfg.get("feeds")
             if not feeds:
@@ -153,6 +192,10 @@ class NewsPipeline:
     def _configure_yahoo_finance(self):
         adapters = []
         yahoo_section = self.config.get("yahoo_finance", {})
+        if not yahoo_section:
+            return adapters
+        from news.adapters.yahoo_finance import YahooFinanceRssAdapter
+
         for name, cfg in yahoo_section.items():
             feeds = cfg.get("feeds")
             if not feeds:
@@ -175,7 +218,12 @@ class NewsPipeline:
 
     def _configure_social(self):
         adapters = []
-        for name, cfg in self.config.get("social_media", {}).items():
+        social_section = self.config.get("social_media", {})
+        if not social_section:
+            return adapters
+        from news.adapters.social import SocialAdapter
+
+        for name, cfg in social_section.items():
             handle = cfg.get("handle")
             if not handle:
                 continue
@@ -191,25 +239,20 @@ class NewsPipeline:
 
     def run(self, markets: Sequence[Market | str], *, limit: int, cache: PipelineCache) -> PipelineResult:
         normalized_markets = [self._ensure_market(m) for m in markets]
-        cached = cache.get([m.value for m in normalized_markets], limit)
+        market_values = tuple(m.value for m in normalized_markets)
+        cached = cache.get(market_values, limit)
         if cached:
             return cached
 
         now = datetime.now(timezone.utc)
         criteria = FetchCriteria(markets=normalized_markets, limit=limit)
-        results: List[NewsItem] = []
         health: List[HealthStatus] = []
+        seen_urls: Set[str] = set()
+        scored: List[Tuple[float, float, NewsItem]] = []
+        now_epoch = now.timestamp()
 
-        # Filter adapters that match the requested markets to avoid unnecessary work
-        relevant_adapters = []
-        for adapter in self.adapters:
-            # Check if adapter's market matches any of the requested markets
-            # This is a heuristic - actual filtering happens in adapter.fetch()
-            if hasattr(adapter, 'market') and adapter.market in criteria.markets:
-                relevant_adapters.append(adapter)
-            else:
-                # For adapters without a specific market (like Google News), include them
-                relevant_adapters.append(adapter)
+        # Only fan out to adapters serving a requested market (plus market-agnostic ones)
+        relevant_adapters = self._adapters_for(criteria.markets)
 
         # Register adapters with scheduler if not already registered
         for adapter in relevant_adapters:
@@ -217,68 +260,119 @@ class NewsPipeline:
             if not self.scheduler.get_source_schedule(adapter_name):
                 self.scheduler.register_source(adapter_name)
 
-        # Optimize thread pool size based on available adapters and system resources
-        # Limit to a reasonable maximum to avoid system resource exhaustion
-        import os
-        cpu_count = os.cpu_count() or 2
-        
-        # More intelligent thread pool sizing:
-        # - Base on relevant adapters count
-        # - Consider CPU cores
-        # - Add buffer for I/O bound operations
-        adapter_count = len(relevant_adapters)
-        max_workers = min(
-            max(2, adapter_count),  # At least 2 workers, up to adapter count
-            cpu_count * 3  # Allow more workers for I/O bound tasks
-        )
-        
-        logger.info(f"Using {max_workers} workers for {adapter_count} adapters")
-        
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_map = {executor.submit(adapter.fetch, criteria, now=now): adapter for adapter in relevant_adapters}
-            for future in as_completed(future_map):
-                adapter = future_map[future]
-                try:
-                    items, status = future.result()
-                    logger.debug(f"Adapter {status.name} fetched {len(items)} items")
-                except Exception as exc:  # pragma: no cover - safety net
-                    status = HealthStatus(name=getattr(adapter, "name", repr(adapter)), healthy=False, last_error=str(exc))
-                    items = []
-                    logger.error(f"Adapter {getattr(adapter, 'name', repr(adapter))} failed: {exc}")
-                
-                # Update scheduler with health status
-                self.scheduler.update_source_health(status)
-                
-                results.extend(items)
-                health.append(status)
-                self._health[status.name] = status
-
-        processed = self._post_process(results, limit)
+        def on_fetched(items: List[NewsItem], status: HealthStatus) -> None:
+            # Update scheduler with health status
+            self.scheduler.update_source_health(status)
+            health.append(status)
+            self._health[status.name] = status
+            # Score this batch now, while slower adapters are still fetching on the worker pool
+            self._score_batch(items, seen_urls, now_epoch, scored)
+
+        executor = self._get_executor()
+        asyncio.run(self._gather_adapters(relevant_adapters, criteria, now, executor, on_fetched))
+
+        processed = self._select_top(scored, limit)
         result = PipelineResult(items=processed, generated_at=now, health=health)
-        cache.set([m.value for m in normalized_markets], limit, result)
+        cache.set(market_values, limit, result)
         return result
 
-    def _post_process(self, items: List[NewsItem], limit: int) -> List[NewsItem]:
-        # Step 1: Remove duplicates
-        deduped = dedupe_by_key(items, key_fn=lambda item: item.url)
-        
-        # Step 2: Score and filter items by relevance
-        scored: List[NewsItem] = []
-        for item in deduped:
-            similarity, score = self.scorer.score(item)
-            if not self.scorer.is_relevant(similarity, item):
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Shared fetch pool, created once and sized for the full adapter set. It is never
+        resized per run: concurrent runs (threaded Flask) may be using it at any time.
+        """
+        executor = self._executor
+        if executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    # I/O bound: at least 2 workers, one per adapter, capped at 3x the cores
+                    cpu_count = os.cpu_count() or 2
+                    max_workers = min(max(2, len(self._adapters)), cpu_count * 3)
+                    logger.info("Using %d workers for %d adapters", max_workers, len(self._adapters))
+                    self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="news-fetch")
+                executor = self._executor
+        return executor
+
+    def close(self) -> None:
+        """Release the shared fetch worker pool."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    async def _gather_adapters(
+        self,
+        adapters: Sequence[object],
+        criteria: FetchCriteria,
+        now: datetime,
+        executor: ThreadPoolExecutor,
+        on_fetched: Callable[[List[NewsItem], HealthStatus], None],
+    ) -> None:
+        """Fan out to all adapters concurrently, handing each result to ``on_fetched`` as it completes."""
+        tasks = [self._fetch_adapter(adapter, criteria, now, executor) for adapter in adapters]
+        for done in asyncio.as_completed(tasks):
+            items, status = await done
+            on_fetched(items, status)
+
+    async def _fetch_adapter(
+        self,
+        adapter,
+        criteria: FetchCriteria,
+        now: datetime,
+        executor: ThreadPoolExecutor,
+    ) -> Tuple[List[NewsItem], HealthStatus]:
+        """Await native ``fetch_async`` adapters; run blocking ``fetch`` in the thread pool."""
+        try:
+            fetch_async = getattr(adapter, "fetch_async", None)
+            if fetch_async is not None:
+                items, status = await fetch_async(criteria, now=now)
+            else:
+                loop = asyncio.get_running_loop()
+                items, status = await loop.run_in_executor(executor, partial(adapter.fetch, criteria, now=now))
+            logger.debug("Adapter %s fetched %d items", status.name, len(items))
+        except Exception as exc:  # pragma: no cover - safety net
+            status = HealthStatus(name=getattr(adapter, "name", repr(adapter)), healthy=False, last_error=str(exc))
+            items = []
+            logger.error("Adapter %s failed: %s", getattr(adapter, "name", repr(adapter)), exc)
+        return items, status
+
+    def _score_batch(
+        self,
+        items: Iterable[NewsItem],
+        seen_urls: Set[str],
+        now_epoch: float,
+        scored: List[Tuple[float, float, NewsItem]],
+    ) -> None:
+        """Drop repeated URLs, score and keep relevant items from one adapter's batch."""
+        scorer = self.scorer
+        for item in items:
+            # Tracking params, fragments and trailing slashes don't make a different story
+            url = canonical_url(item.url)
+            if url in seen_urls:
                 continue
+            seen_urls.add(url)
+            similarity, score = scorer.score(item, now_epoch)
+            if scorer.is_relevant(similarity, item):
+                scored.append((score, similarity, item))
+
+    def _select_top(self, scored: List[Tuple[float, float, NewsItem]], limit: int) -> List[NewsItem]:
+        # Step 1: Best first, so near-duplicate removal keeps the highest-scored copy. Batches
+        # arrive in adapter-completion order, so ties break on the item itself, not on arrival.
+        scored = sorted(scored, key=lambda entry: (-entry[0], -entry[1], entry[2].url, entry[2].title))
+
+        # Step 2: Drop near-identical headlines syndicated across sources (relevant items only)
+        scored = dedupe_near_duplicates(scored, text_fn=lambda entry: entry[2].title)
+
+        # Step 3: Dedupe preserves order, so the top `limit` items are the head of the list
+        top = scored[:limit]
+        selected: List[NewsItem] = []
+        for score, similarity, item in top:
             item.semantic_similarity = similarity
             item.relevance_score = score
-            scored.append(item)
-        
-        # Step 3: Analyze sentiment for all scored items
-        sentiment_analyzed = self.sentiment_analyzer.analyze_batch(scored)
-        
-        # Step 4: Sort by relevance score and limit results
-        sentiment_analyzed.sort(key=lambda itm: itm.relevance_score or 0, reverse=True)
+            selected.append(item)
         
-        return sentiment_analyzed[:limit]
+        # Step 4: Analyze sentiment only for the items we return
+        return self.sentiment_analyzer.analyze_batch(selected)
 
     def _ensure_market(self, value: Market | str) -> Market:
         """Ensure a market value is a valid Market enum.
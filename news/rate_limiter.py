@@ -10,20 +10,26 @@ from typing import Dict
 
 class RateLimiter:
     def __init__(self) -> None:
-        self._limits: Dict[str, float] = {}
-        self._last_hit: Dict[str, float] = {}
-        self._lock = threading.Lock()
+        self._limits: Dict[str, int] = {}
+        self._last_hit: Dict[str, int] = {}
+        # One lock per key so adapters hitting different keys never wait on each other
+        self._locks: Dict[str, threading.Lock] = {}
 
     def configure(self, key: str, min_interval: float) -> None:
-        self._limits[key] = min_interval
+        self._limits[key] = int(min_interval * 1e9)
 
     def wait(self, key: str) -> None:
-        interval = self._limits.get(key)
-        if interval is None:
+        interval_ns = self._limits.get(key)
+        if interval_ns is None:
             return
-        with self._lock:
-            now = time.time()
-            last = self._last_hit.get(key, 0.0)
-            if now - last < interval:
-                time.sleep(interval - (now - last))
-            self._last_hit[key] = time.time()
+        lock = self._locks.get(key)
+        if lock is None:
+            # setdefault is atomic under the GIL, so racing callers share one lock
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            now = time.monotonic_ns()
+            last = self._last_hit.get(key)
+            if last is not None and now - last < interval_ns:
+                time.sleep((interval_ns - (now - last)) / 1e9)
+                now = time.monotonic_ns()
+            self._last_hit[key] = now
@@ -3,9 +3,10 @@ Smart scheduler for news fetching based on source characteristics.
 """
 from __future__ import annotations
 
+import heapq
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from news.models import HealthStatus
 
@@ -91,8 +92,13 @@ class SourceSchedule:
         self.update_frequency = max(self.min_interval, min(self.max_interval, new_interval))
         
         logger.debug(
-            f"Source {self.source_name}: adjusted frequency to {self.update_frequency} (adjustment: {adjustment:.2f}, "
-            f"success: {self.success_count}, failure: {self.failure_count}, latency: {self.avg_latency:.0f}ms)"
+            "Source %s: adjusted frequency to %s (adjustment: %.2f, success: %d, failure: %d, latency: %.0fms)",
+            self.source_name,
+            self.update_frequency,
+            adjustment,
+            self.success_count,
+            self.failure_count,
+            self.avg_latency,
         )
     
     def should_fetch(self, now: datetime) -> bool:
@@ -139,6 +145,10 @@ class NewsScheduler:
     
     def __init__(self) -> None:
         self._schedules: Dict[str, SourceSchedule] = {}
+        # Min-heap of (next_fetch, source_name); entries whose time no longer matches the
+        # schedule are stale and skipped lazily when popped.
+        self._due_heap: List[Tuple[datetime, str]] = []
+        self._queued: Dict[str, datetime] = {}
     
     def register_source(
         self,
@@ -158,13 +168,21 @@ class NewsScheduler:
             min_interval: Minimum fetch interval.
             max_interval: Maximum fetch interval.
         """
-        self._schedules[source_name] = SourceSchedule(
+        schedule = SourceSchedule(
             source_name=source_name,
             base_interval=base_interval,
             priority=priority,
             min_interval=min_interval,
             max_interval=max_interval,
         )
+        self._schedules[source_name] = schedule
+        self._enqueue(schedule)
+    
+    def _enqueue(self, schedule: SourceSchedule) -> None:
+        if self._queued.get(schedule.source_name) == schedule.next_fetch:
+            return
+        self._queued[schedule.source_name] = schedule.next_fetch
+        heapq.heappush(self._due_heap, (schedule.next_fetch, schedule.source_name))
     
     def update_source_health(self, health: HealthStatus) -> None:
         """
@@ -187,16 +205,30 @@ class NewsScheduler:
             List of source names that should be fetched now, sorted by priority.
         """
         now = now or datetime.now()
-        sources_to_fetch = []
+        due: List[SourceSchedule] = []
+        
+        # Pop only the entries that are due: O(k log S) instead of scanning every schedule
+        heap = self._due_heap
+        while heap and heap[0][0] <= now:
+            next_fetch, source_name = heapq.heappop(heap)
+            schedule = self._schedules.get(source_name)
+            if schedule is None or self._queued.get(source_name) != next_fetch:
+                continue
+            del self._queued[source_name]
+            if schedule.next_fetch != next_fetch:
+                # Schedule was moved without going through mark_source_fetched; requeue it
+                self._enqueue(schedule)
+                continue
+            due.append(schedule)
         
-        for source_name, schedule in self._schedules.items():
-            if schedule.should_fetch(now):
-                sources_to_fetch.append((source_name, schedule.priority))
+        # Querying must not consume the schedules: put the due entries back
+        for schedule in due:
+            self._enqueue(schedule)
         
         # Sort by priority (highest first)
-        sources_to_fetch.sort(key=lambda x: x[1], reverse=True)
+        due.sort(key=lambda schedule: schedule.priority, reverse=True)
         
-        return [source_name for source_name, _ in sources_to_fetch]
+        return [schedule.source_name for schedule in due]
     
     def mark_source_fetched(self, source_name: str, now: Optional[datetime] = None) -> None:
         """
@@ -207,8 +239,10 @@ class NewsScheduler:
             now: Current datetime (defaults to now).
         """
         now = now or datetime.now()
-        if source_name in self._schedules:
-            self._schedules[source_name].mark_fetched(now)
+        schedule = self._schedules.get(source_name)
+        if schedule is not None:
+            schedule.mark_fetched(now)
+            self._enqueue(schedule)
     
     def get_source_schedule(self, source_name: str) -> Optional[SourceSchedule]:
         """
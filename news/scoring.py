@@ -3,11 +3,18 @@ Semantic filtering + scoring for normalized news items.
 """
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Dict, List, Tuple
+import time
+from datetime import timezone
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional C extension; substring scan is the fallback
+    ahocorasick = None
 
 from news.models import ContentType, Market, NewsItem
-from utils.keywords import A_SHARE_KEYWORDS
+from utils.keywords import A_SHARE_KEYWORDS, a_share_automaton
 
 
 BASE_KEYWORDS = [
@@ -25,7 +32,7 @@ BASE_KEYWORDS = [
     "geopolitics",
 ]
 
-MARKET_KEYWORDS: Dict[Market, List[str]] = {
+MARKET_KEYWORDS: Dict[Market, Sequence[str]] = {
     Market.A_SHARE: A_SHARE_KEYWORDS,
     Market.US: BASE_KEYWORDS + ["S&P", "Dow", "Treasury"],
     Market.JAPAN: BASE_KEYWORDS + ["Nikkei", "BOJ"],
@@ -34,18 +41,78 @@ MARKET_KEYWORDS: Dict[Market, List[str]] = {
     Market.CRYPTO: ["bitcoin", "ethereum", "token", "defi"],
 }
 
+_MATCH_CACHE_SIZE = 4096
+
+
+def _compile_counter(keywords: Tuple[str, ...]) -> Callable[[str], int]:
+    """
+    Generate a straight-line ``text -> matches`` function with the keywords baked in
+    as constants, e.g. ``c += 'stock' in text`` per keyword, so no loop or generator
+    runs per call.
+    """
+    lines = ["def _count(text):", "    c = 0"]
+    lines.extend(f"    c += {kw!r} in text" for kw in keywords)
+    lines.append("    return c")
+    namespace: Dict[str, Callable[[str], int]] = {}
+    exec(compile("\n".join(lines), "<keyword-counter>", "exec"), namespace)
+    return namespace["_count"]
+
+
+class _KeywordMatcher:
+    """
+    Counts how many distinct keywords occur in a lowercased text.
+
+    Keywords are lowercased once; with pyahocorasick installed all of them are
+    found in a single pass over the text, otherwise a generated counter checks
+    each keyword with an inlined substring test.
+    """
+
+    def __init__(self, keywords: Sequence[str], automaton=None) -> None:
+        self.keywords = tuple(dict.fromkeys(kw.lower() for kw in keywords))
+        # Reciprocal precomputed so similarity is a multiply per item
+        self.inv_len = 1.0 / max(len(self.keywords), 1)
+        # A prebuilt automaton over exactly these lowercased keywords may be shared in
+        if automaton is None and ahocorasick is not None and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for kw in self.keywords:
+                automaton.add_word(kw, kw)
+            automaton.make_automaton()
+        self._automaton = automaton
+        if automaton is not None:
+            count = self._count_automaton
+        else:
+            count = _compile_counter(self.keywords)
+        # Match counts depend only on the text, so re-scored items (new limit, cache miss) hit the LRU
+        self.count: Callable[[str], int] = lru_cache(maxsize=_MATCH_CACHE_SIZE)(count)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _count_automaton(self, text: str) -> int:
+        return len({kw for _, kw in self._automaton.iter(text)})
+
 
 class SemanticScorer:
     def __init__(self, similarity_threshold: float = 0.01) -> None:
         self.similarity_threshold = similarity_threshold
+        self._default_matcher = _KeywordMatcher(BASE_KEYWORDS)
+        self._matchers: Dict[Market, _KeywordMatcher] = {
+            # A-share keywords come with the shared automaton from utils.keywords
+            market: _KeywordMatcher(keywords, a_share_automaton() if market is Market.A_SHARE else None)
+            for market, keywords in MARKET_KEYWORDS.items()
+        }
 
-    def score(self, item: NewsItem) -> Tuple[float, float]:
-        keywords = MARKET_KEYWORDS.get(item.market, BASE_KEYWORDS)
-        combined = f"{item.title} {item.description}".lower()
-        matches = sum(1 for kw in keywords if kw.lower() in combined)
-        similarity = matches / max(len(keywords), 1)
+    def score(self, item: NewsItem, now_epoch: Optional[float] = None) -> Tuple[float, float]:
+        """
+        Return ``(similarity, score)`` for an item. Batch callers should pass a single
+        ``now_epoch`` (``time.time()``) so the clock is read once per batch, not per item.
+        """
+        matcher = self._matchers.get(item.market, self._default_matcher)
+        combined = item.text_lower()
+        matches = matcher.count(combined)
+        similarity = matches * matcher.inv_len
         base = 0.6 if item.content_type == ContentType.FINANCIAL_NEWS else 0.4
-        recency_bonus = self._recency_boost(item.published_at)
+        recency_bonus = self._recency_boost(item.published_at, time.time() if now_epoch is None else now_epoch)
         score = min(1.0, base + min(0.35, matches * 0.02) + recency_bonus)
         return similarity, score
 
@@ -55,12 +122,12 @@ class SemanticScorer:
         return similarity >= self.similarity_threshold
 
     @staticmethod
-    def _recency_boost(published_at):
+    def _recency_boost(published_at, now_epoch: float):
         if not published_at:
             return 0.0
         if not published_at.tzinfo:
             published_at = published_at.replace(tzinfo=timezone.utc)
-        hours_old = (datetime.now(timezone.utc) - published_at).total_seconds() / 3600.0
+        hours_old = (now_epoch - published_at.timestamp()) / 3600.0
         if hours_old < 1:
             return 0.15
         if hours_old < 6:
@@ -5,12 +5,15 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 from news.models import NewsItem
 
 logger = logging.getLogger(__name__)
 
+_SENTIMENT_CACHE_SIZE = 10_000
+
 try:
     from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
     VADER_AVAILABLE = True
@@ -36,14 +39,36 @@ def _get_sentiment_label(score: float) -> str:
         return "neutral"
 
 
+@lru_cache(maxsize=1)
+def _shared_vader() -> Optional["SentimentIntensityAnalyzer"]:
+    """Build the VADER analyzer once per process; it parses its lexicon files on construction."""
+    return SentimentIntensityAnalyzer() if VADER_AVAILABLE else None
+
+
+def _apply_sentiment(item: NewsItem, sentiment: Dict[str, float]) -> None:
+    """Copy VADER polarity scores onto a news item."""
+    compound_score = sentiment["compound"]
+    item.sentiment_score = compound_score
+    item.sentiment_label = _get_sentiment_label(compound_score)
+    item.sentiment_dimensions = {
+        "negative": sentiment["neg"],
+        "neutral": sentiment["neu"],
+        "positive": sentiment["pos"],
+    }
+
+
 class SentimentAnalyzer:
     """
     Analyzes sentiment of news items using VADER sentiment analyzer.
     """
     
     def __init__(self):
-        self.analyzer = SentimentIntensityAnalyzer() if VADER_AVAILABLE else None
+        self.analyzer = _shared_vader()
         self.enabled = VADER_AVAILABLE
+        # VADER is deterministic per text; memoize so re-runs over the same stories skip re-tokenizing
+        self._polarity_scores = (
+            lru_cache(maxsize=_SENTIMENT_CACHE_SIZE)(self.analyzer.polarity_scores) if self.analyzer else None
+        )
     
     def analyze(self, item: NewsItem) -> NewsItem:
         """
@@ -63,23 +88,11 @@ class SentimentAnalyzer:
             text = f"{item.title} {item.description}"
             
             # Analyze sentiment
-            sentiment = self.analyzer.polarity_scores(text)
-            
-            # Extract sentiment score and label
-            compound_score = sentiment["compound"]
-            label = _get_sentiment_label(compound_score)
-            
-            # Update news item with sentiment analysis results
-            item.sentiment_score = compound_score
-            item.sentiment_label = label
-            item.sentiment_dimensions = {
-                "negative": sentiment["neg"],
-                "neutral": sentiment["neu"],
-                "positive": sentiment["pos"],
-            }
+            sentiment = self._polarity_scores(text)
+            _apply_sentiment(item, sentiment)
             
         except Exception as exc:
-            logger.error(f"Sentiment analysis failed for news item {item.url}: {exc}")
+            logger.error("Sentiment analysis failed for news item %s: %s", item.url, exc)
         
         return item
     
@@ -96,7 +109,14 @@ class SentimentAnalyzer:
         if not self.enabled:
             return items
         
-        return [self.analyze(item) for item in items]
+        polarity_scores = self._polarity_scores
+        for item in items:
+            text = f"{item.title} {item.description}"
+            try:
+                _apply_sentiment(item, polarity_scores(text))
+            except Exception as exc:
+                logger.error("Sentiment analysis failed for news item %s: %s", item.url, exc)
+        return items
     
     def get_sentiment_trend(self, items: List[NewsItem], window_hours: int = 24) -> Dict[str, float]:
         """
@@ -118,16 +138,25 @@ class SentimentAnalyzer:
                 "total_count": 0,
             }
         
-        # Filter items within time window
-        now = datetime.now()
-        window_start = now - timedelta(hours=window_hours)
+        # Filter and aggregate in a single pass over the items
+        window_start = datetime.now() - timedelta(hours=window_hours)
+        label_counts = {"positive": 0, "negative": 0}
+        total_sentiment = 0.0
+        total_count = 0
         
-        recent_items = []
         for item in items:
-            if item.published_at and item.published_at >= window_start:
-                recent_items.append(item)
+            published_at = item.published_at
+            if not published_at or published_at < window_start:
+                continue
+            total_count += 1
+            score = item.sentiment_score
+            if score is not None:
+                total_sentiment += score
+            label = item.sentiment_label
+            if label in label_counts:
+                label_counts[label] += 1
         
-        if not recent_items:
+        if not total_count:
             return {
                 "average_sentiment": 0.0,
                 "positive_count": 0,
@@ -136,27 +165,12 @@ class SentimentAnalyzer:
                 "total_count": 0,
             }
         
-        # Calculate sentiment metrics
-        positive_count = 0
-        negative_count = 0
-        neutral_count = 0
-        total_sentiment = 0.0
-        
-        for item in recent_items:
-            if item.sentiment_score is not None:
-                total_sentiment += item.sentiment_score
-            
-            if item.sentiment_label == "positive":
-                positive_count += 1
-            elif item.sentiment_label == "negative":
-                negative_count += 1
-            else:
-                neutral_count += 1
-        
+        positive_count = label_counts["positive"]
+        negative_count = label_counts["negative"]
         return {
-            "average_sentiment": total_sentiment / len(recent_items),
+            "average_sentiment": total_sentiment / total_count,
             "positive_count": positive_count,
             "negative_count": negative_count,
-            "neutral_count": neutral_count,
-            "total_count": len(recent_items),
+            "neutral_count": total_count - positive_count - negative_count,
+            "total_count": total_count,
         }
@@ -8,22 +8,28 @@ from __future__ import annotations
 
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from news.models import Market
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NewsSettings:
     default_markets: List[Market]
     pipeline_limit: int
     cache_ttl_seconds: int
     cache_path: Path
     cache_max_entries: int
+    # Derived once from default_markets; status payloads emit it as-is
+    default_market_values: Tuple[str, ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "default_market_values", tuple(m.value for m in self.default_markets))
 
 
 def _int_from_env(key: str, default: int) -> int:
@@ -39,21 +45,16 @@ def _int_from_env(key: str, default: int) -> int:
 
 
 def _parse_markets(raw: str | None) -> List[Market]:
-    if not raw:
-        return [Market.GLOBAL, Market.US, Market.A_SHARE]
-    markets: List[Market] = []
-    for token in raw.split(","):
-        token = token.strip().lower()
-        if not token:
-            continue
-        try:
-            markets.append(Market(token))
-        except ValueError:
-            logger.warning("Unknown market token '%s' in NEWS_DEFAULT_MARKETS; skipping.", token)
+    markets = Market.parse_many(
+        raw,
+        on_unknown=lambda token: logger.warning(
+            "Unknown market token '%s' in NEWS_DEFAULT_MARKETS; skipping.", str(token).strip()
+        ),
+    )
     return markets or [Market.GLOBAL, Market.US, Market.A_SHARE]
 
 
-def load_settings() -> NewsSettings:
+def _build_settings() -> NewsSettings:
     cache_path_env = os.getenv("NEWS_CACHE_PATH")
     cache_path = Path(cache_path_env) if cache_path_env else Path(__file__).resolve().parent / ".pipeline_cache.json"
     return NewsSettings(
@@ -63,3 +64,14 @@ def load_settings() -> NewsSettings:
         cache_path=cache_path,
         cache_max_entries=_int_from_env("NEWS_CACHE_MAX_ENTRIES", 4),
     )
+
+
+@lru_cache(maxsize=1)
+def load_settings() -> NewsSettings:
+    """Return the process-wide settings, reading the environment on first use only."""
+    return _build_settings()
+
+
+def reset_settings() -> None:
+    """Drop the cached settings so the next ``load_settings`` re-reads the environment."""
+    load_settings.cache_clear()
@@ -6,35 +6,46 @@ dependency-check style payloads while keeping data light-weight and redacted.
 """
 from __future__ import annotations
 
+import json
+import operator
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from news.cache import PipelineCache
 from news.models import HealthStatus
 from news.pipeline import NewsPipeline
-from news.settings import NewsSettings
+from news.settings import NewsSettings, load_settings
 
+_UTC = timezone.utc
+_now = datetime.now
 
-def _health_to_dict(status: HealthStatus) -> Dict[str, Any]:
-    return {
-        "name": status.name,
-        "healthy": status.healthy,
-        "last_error": status.last_error,
-        "last_success": status.last_success.isoformat() if status.last_success else None,
-        "items_last_fetch": status.items_last_fetch,
-        "latency_ms": status.latency_ms,
-        "extra": status.extra,
-    }
+HEALTH_FIELDS = ("name", "healthy", "last_error", "last_success", "items_last_fetch", "latency_ms", "extra")
+_get_health = operator.attrgetter(*HEALTH_FIELDS)
+
+
+def health_to_dict(status: HealthStatus) -> Dict[str, Any]:
+    """JSON-ready view of one adapter's health: ``HEALTH_FIELDS``, ``last_success`` as ISO-8601."""
+    payload = dict(zip(HEALTH_FIELDS, _get_health(status)))
+    last_success = payload["last_success"]
+    if last_success is not None:
+        payload["last_success"] = last_success.isoformat()
+    return payload
 
 
-def build_status(pipeline: NewsPipeline, cache: PipelineCache, settings: NewsSettings) -> Dict[str, Any]:
-    health = [_health_to_dict(entry) for entry in pipeline.get_health()]
+def _status_payload(
+    health: Sequence[Any], cache: PipelineCache, settings: NewsSettings
+) -> Dict[str, Any]:
     return {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": _now(_UTC).isoformat(timespec="seconds"),
         "pipeline": {
             "health": health,
             "adapter_count": len(health),
-            "default_markets": [m.value for m in settings.default_markets],
+            "default_markets": settings.default_market_values,
             "default_limit": settings.pipeline_limit,
         },
         "cache": cache.snapshot(),
@@ -44,3 +55,23 @@ def build_status(pipeline: NewsPipeline, cache: PipelineCache, settings: NewsSet
             "cache_max_entries": settings.cache_max_entries,
         },
     }
+
+
+def build_status(
+    pipeline: NewsPipeline, cache: PipelineCache, settings: Optional[NewsSettings] = None
+) -> Dict[str, Any]:
+    if settings is None:
+        settings = load_settings()
+    health: List[Dict[str, Any]] = [health_to_dict(entry) for entry in pipeline.get_health()]
+    return _status_payload(health, cache, settings)
+
+
+def build_status_json(
+    pipeline: NewsPipeline, cache: PipelineCache, settings: Optional[NewsSettings] = None
+) -> bytes:
+    """Serialised ``build_status`` payload; with orjson the health dataclasses are encoded natively."""
+    if settings is None:
+        settings = load_settings()
+    if orjson is not None:
+        return orjson.dumps(_status_payload(pipeline.get_health(), cache, settings))
+    return json.dumps(build_status(pipeline, cache, settings)).encode("utf-8")
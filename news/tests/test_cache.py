@@ -1,58 +1,84 @@
 import json
+import os
 import tempfile
 import time
 import unittest
+from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 from news.cache import PipelineCache
 from news.models import ContentType, HealthStatus, Market, NewsItem, PipelineResult
 
 
-def _make_result(title: str) -> PipelineResult:
-    now = datetime.now(timezone.utc)
-    item = NewsItem(
-        title=title,
-        description="desc",
-        url=f"https://example.com/{title}",
-        source="unit",
-        market=Market.GLOBAL,
-        content_type=ContentType.FINANCIAL_NEWS,
-        published_at=now,
-    )
-    health = [
-        HealthStatus(
-            name=f"{title}-adapter",
+class PipelineCacheTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._now = datetime.now(timezone.utc)
+        cls._base_item = NewsItem(
+            title="base",
+            description="desc",
+            url="https://example.com/base",
+            source="unit",
+            market=Market.GLOBAL,
+            content_type=ContentType.FINANCIAL_NEWS,
+            published_at=cls._now,
+        )
+        cls._base_health = HealthStatus(
+            name="base-adapter",
             healthy=True,
-            last_success=now,
+            last_success=cls._now,
             items_last_fetch=1,
         )
-    ]
-    return PipelineResult(items=[item], generated_at=now, health=health)
 
+    def _make_result(self, title: str) -> PipelineResult:
+        item = replace(self._base_item, title=title, url=f"https://example.com/{title}")
+        health = [replace(self._base_health, name=f"{title}-adapter")]
+        return PipelineResult(items=[item], generated_at=self._now, health=health)
 
-class PipelineCacheTests(unittest.TestCase):
     def setUp(self) -> None:
-        self.cache_path = Path(tempfile.gettempdir()) / "pipeline_cache_test.json"
-        self.cache_path.unlink(missing_ok=True)
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self._tmp.name) / "pipeline_cache_test.json"
 
     def tearDown(self) -> None:
-        self.cache_path.unlink(missing_ok=True)
+        self._tmp.cleanup()
 
     def test_persists_multiple_entries_and_evicts_oldest(self):
-        cache = PipelineCache(ttl_seconds=60, storage_path=self.cache_path, max_entries=2)
-        cache.set([Market.US.value], 5, _make_result("first"))
-        cache.set([Market.GLOBAL.value], 3, _make_result("second"))
+        cache = PipelineCache(ttl_seconds=60, storage_path=self.cache_path, max_entries=2, thread_safe=False)
+        cache.set([Market.US.value], 5, self._make_result("first"))
+        cache.set([Market.GLOBAL.value], 3, self._make_result("second"))
 
         self.assertIsNotNone(cache.get([Market.US.value], 5))
         self.assertIsNotNone(cache.get([Market.GLOBAL.value], 3))
 
         # Insert third entry -> oldest disk entry should be evicted to respect max_entries
-        cache.set([Market.A_SHARE.value], 2, _make_result("third"))
+        cache.set([Market.A_SHARE.value], 2, self._make_result("third"))
         disk_entries = cache.snapshot()["disk_entries"]
         self.assertLessEqual(len(disk_entries), 2)
         self.assertIsNotNone(cache.get([Market.A_SHARE.value], 2))
 
+    def test_interleaved_writers_use_separate_temp_files(self):
+        # Two instances share no lock, like two app processes writing one cache file
+        first = PipelineCache(ttl_seconds=60, storage_path=self.cache_path, max_entries=3)
+        second = PipelineCache(ttl_seconds=60, storage_path=self.cache_path, max_entries=3)
+        real_replace = os.replace
+        interleaved = []
+
+        def replace_after_other_writer(src, dst):
+            # The other writer runs a whole set() between this writer's temp write and its rename
+            if not interleaved:
+                interleaved.append(src)
+                second.set([Market.GLOBAL.value], 3, self._make_result("s" * 2000))
+            real_replace(src, dst)
+
+        with patch("news.cache.os.replace", side_effect=replace_after_other_writer):
+            first.set([Market.US.value], 5, self._make_result("first"))
+
+        payload = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        self.assertIn(first._key([Market.US.value], 5), payload["entries"])
+        self.assertEqual([p.name for p in self.cache_path.parent.iterdir()], [self.cache_path.name])
+
     def test_reads_legacy_single_entry_format(self):
         legacy_payload = {
             "key": "global:5",
@@ -87,7 +113,7 @@ class PipelineCacheTests(unittest.TestCase):
         }
         self.cache_path.write_text(json.dumps(legacy_payload), encoding="utf-8")
 
-        cache = PipelineCache(ttl_seconds=60, storage_path=self.cache_path, max_entries=2)
+        cache = PipelineCache(ttl_seconds=60, storage_path=self.cache_path, max_entries=2, thread_safe=False)
         result = cache.get([Market.GLOBAL.value], 5)
         self.assertIsNotNone(result)
         self.assertEqual(result.items[0].title, "legacy")
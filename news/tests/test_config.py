@@ -0,0 +1,37 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from utils.config import CollectionConfig, get_collection_config, reset_collection_config
+
+
+class CollectionConfigTests(unittest.TestCase):
+    def setUp(self):
+        reset_collection_config()
+        self.addCleanup(reset_collection_config)
+
+    def test_dict_style_access_matches_attributes(self):
+        with patch.dict(os.environ, {"NEWS_PAGES": "4", "CSE_NUM": "not-a-number"}):
+            cfg = get_collection_config()
+        self.assertIsInstance(cfg, CollectionConfig)
+        self.assertEqual(cfg["news_pages"], 4)
+        self.assertEqual(cfg["cse_num"], cfg.cse_num)
+        self.assertEqual(cfg.cse_num, 10)
+        self.assertEqual(cfg.to_dict()["news_pages"], 4)
+        self.assertEqual(set(cfg.to_dict()), {
+            "news_pages", "news_page_size", "news_days", "tavily_max_results", "tavily_days", "cse_pages", "cse_num",
+        })
+        with self.assertRaises(KeyError):
+            cfg["missing"]
+
+    def test_cached_until_reset(self):
+        with patch.dict(os.environ, {"NEWS_DAYS": "5"}):
+            cfg = get_collection_config()
+        with patch.dict(os.environ, {"NEWS_DAYS": "7"}):
+            self.assertIs(get_collection_config(), cfg)
+            reset_collection_config()
+            self.assertEqual(get_collection_config().news_days, 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,14 +20,13 @@ SAMPLE_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
   </channel>
 </rss>
 """
+_SAMPLE_RESPONSE = MagicMock(content=SAMPLE_FEED)
 
 
 class GoogleNewsAdapterTests(unittest.TestCase):
     @patch("news.adapters.google_news.HttpFetcher.fetch")
     def test_fetch_returns_items(self, mock_fetch):
-        response = MagicMock()
-        response.content = SAMPLE_FEED
-        mock_fetch.return_value = response
+        mock_fetch.return_value = _SAMPLE_RESPONSE
 
         adapter = GoogleNewsRssAdapter(
             queries=["global markets"],
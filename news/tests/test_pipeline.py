@@ -1,3 +1,6 @@
+import tempfile
+import threading
+import time
 import unittest
 from datetime import datetime, timezone
 from pathlib import Path
@@ -22,6 +25,16 @@ class _StaticAdapter:
         )
 
 
+class _SlowMarketAdapter(_StaticAdapter):
+    def __init__(self, name: str, market: Market):
+        super().__init__(name, [])
+        self.market = market
+
+    def fetch(self, criteria, *, now):
+        time.sleep(0.005)
+        return super().fetch(criteria, now=now)
+
+
 class PipelineTests(unittest.TestCase):
     @patch("news.pipeline.load_sources_config", return_value={})
     def test_pipeline_deduplicates_and_scores(self, _mock_config):
@@ -43,10 +56,18 @@ class PipelineTests(unittest.TestCase):
                 market=Market.US,
                 content_type=ContentType.FINANCIAL_NEWS,
             ),
+            NewsItem(
+                title="Tracked link to the same story",
+                description="Same URL with tracking params",
+                url="https://example.com/fed/?utm_source=feed&utm_medium=rss#top",
+                source="ThirdWire",
+                market=Market.US,
+                content_type=ContentType.FINANCIAL_NEWS,
+            ),
         ]
         pipeline = NewsPipeline()
         pipeline.adapters = [_StaticAdapter("static", adapter_items)]
-        cache = PipelineCache(ttl_seconds=0, storage_path=Path("news/.test_pipeline_cache.json"))
+        cache = PipelineCache(ttl_seconds=0, storage_path=Path("news/.test_pipeline_cache.json"), thread_safe=False)
 
         result = pipeline.run([Market.US], limit=5, cache=cache)
         self.assertEqual(len(result.items), 1)
@@ -54,6 +75,87 @@ class PipelineTests(unittest.TestCase):
         self.assertGreater(item.relevance_score or 0, 0.6)
         self.assertEqual(item.url, "https://example.com/fed")
 
+    @patch("news.pipeline.load_sources_config", return_value={})
+    def test_pipeline_drops_near_duplicate_headlines(self, _mock_config):
+        adapter_items = [
+            NewsItem(
+                title="Fed cuts rates to calm markets",
+                description="Central bank surprise move boosts stocks",
+                url="https://example.com/fed",
+                source="ExampleWire",
+                market=Market.US,
+                content_type=ContentType.FINANCIAL_NEWS,
+            ),
+            NewsItem(
+                title="Fed cuts rates to calm markets!",
+                description="Syndicated copy of the same story",
+                url="https://mirror.example.com/fed-cuts-rates",
+                source="AnotherWire",
+                market=Market.US,
+                content_type=ContentType.FINANCIAL_NEWS,
+            ),
+        ]
+        pipeline = NewsPipeline()
+        pipeline.adapters = [_StaticAdapter("static", adapter_items)]
+        cache = PipelineCache(ttl_seconds=0, storage_path=Path("news/.test_pipeline_cache.json"), thread_safe=False)
+
+        result = pipeline.run([Market.US], limit=5, cache=cache)
+        self.assertEqual([item.url for item in result.items], ["https://example.com/fed"])
+
+    @patch("news.pipeline.load_sources_config", return_value={})
+    def test_near_duplicate_keeps_highest_scored_copy(self, _mock_config):
+        adapter_items = [
+            NewsItem(
+                title="Fed cuts rates to calm markets",
+                description="Older social copy, lower score",
+                url="https://social.example.com/fed",
+                source="SocialWire",
+                market=Market.US,
+                content_type=ContentType.SOCIAL_MEDIA,
+            ),
+            NewsItem(
+                title="Fed cuts rates to calm markets!",
+                description="Fresh financial news copy, higher score",
+                url="https://example.com/fed",
+                source="ExampleWire",
+                market=Market.US,
+                content_type=ContentType.FINANCIAL_NEWS,
+                published_at=datetime.now(timezone.utc),
+            ),
+        ]
+        pipeline = NewsPipeline()
+        pipeline.adapters = [_StaticAdapter("static", adapter_items)]
+        cache = PipelineCache(ttl_seconds=0, storage_path=Path("news/.test_pipeline_cache.json"), thread_safe=False)
+
+        result = pipeline.run([Market.US], limit=5, cache=cache)
+        self.assertEqual([item.url for item in result.items], ["https://example.com/fed"])
+
+    @patch("news.pipeline.load_sources_config", return_value={})
+    def test_concurrent_runs_share_fetch_pool(self, _mock_config):
+        pipeline = NewsPipeline()
+        # Markets with different adapter counts must not resize (and shut down) the shared pool
+        pipeline.adapters = [_SlowMarketAdapter(f"us{i}", Market.US) for i in range(3)] + [
+            _SlowMarketAdapter("global0", Market.GLOBAL)
+        ]
+        failures = []
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = PipelineCache(ttl_seconds=0, storage_path=Path(tmp) / "cache.json")
+
+            def worker(market):
+                for _ in range(15):
+                    result = pipeline.run([market], limit=5, cache=cache)
+                    failures.extend(status.last_error for status in result.health if not status.healthy)
+
+            threads = [threading.Thread(target=worker, args=(market,)) for market in (Market.US, Market.GLOBAL)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        pipeline.close()
+
+        self.assertEqual(failures, [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,60 @@
+import json
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+from news import status
+from news.cache import PipelineCache
+from news.models import HealthStatus
+from news.settings import load_settings
+
+
+class _StubPipeline:
+    def __init__(self, health):
+        self._health = health
+
+    def get_health(self):
+        return list(self._health)
+
+
+class StatusJsonTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache = PipelineCache(ttl_seconds=60, storage_path=Path(self._tmp.name) / "cache.json")
+        self.pipeline = _StubPipeline(
+            [
+                HealthStatus(
+                    name="static",
+                    healthy=True,
+                    last_success=datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+                    items_last_fetch=3,
+                    latency_ms=12.5,
+                    extra={"region": "us"},
+                ),
+                HealthStatus(name="broken", healthy=False, last_error="timeout"),
+            ]
+        )
+        self.settings = load_settings()
+        fixed_now = datetime(2024, 5, 1, 13, 0, tzinfo=timezone.utc)
+        patcher = patch.object(status, "_now", lambda tz: fixed_now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _expected(self):
+        return json.loads(json.dumps(status.build_status(self.pipeline, self.cache, self.settings)))
+
+    def test_build_status_json_matches_build_status(self):
+        payload = json.loads(status.build_status_json(self.pipeline, self.cache, self.settings))
+        self.assertEqual(payload, self._expected())
+
+    def test_build_status_json_without_orjson(self):
+        with patch.object(status, "orjson", None):
+            payload = json.loads(status.build_status_json(self.pipeline, self.cache, self.settings))
+        self.assertEqual(payload, self._expected())
+
+
+if __name__ == "__main__":
+    unittest.main()
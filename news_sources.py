@@ -14,13 +14,19 @@ from typing import Any, Dict, Iterable, List, Optional
 import argparse
 import json
 import os
-from datetime import datetime
+import sys
+from datetime import datetime, timezone
 
 try:
     from dotenv import load_dotenv
 except ImportError:  # pragma: no cover - optional dependency
     load_dotenv = None
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from news.legacy import NewsSourceManagerV2
 from news.models import Market
 
@@ -43,19 +49,13 @@ class NewsSourceManager(NewsSourceManagerV2):
             logger.warning("NewsSourceManager: falling back to default markets; unknown tokens supplied.")
 
 
+def _warn_unknown_market(value: object) -> None:
+    logger.warning("NewsSourceManager: ignoring unknown market '%s'", value)
+
+
 def _normalize_markets(markets: Optional[Iterable[Market | str]]):
-    if not markets:
-        return None
-    result: List[Market] = []
-    for value in markets:
-        if isinstance(value, Market):
-            result.append(value)
-            continue
-        try:
-            result.append(Market(str(value).lower()))
-        except ValueError:
-            logger.warning("NewsSourceManager: ignoring unknown market '%s'", value)
-    return result or None
+    # Market members pass straight through parse_many; only raw tokens are looked up
+    return Market.parse_many(markets, on_unknown=_warn_unknown_market) or None
 
 
 def get_enhanced_news_data(limit: int = 20) -> List[Dict[str, Any]]:
@@ -64,24 +64,29 @@ def get_enhanced_news_data(limit: int = 20) -> List[Dict[str, Any]]:
 
 
 def _format_health(health: Dict[str, Any]) -> str:
-    lines = []
-    for name, payload in health.items():
-        if name == "last_fetch":
-            continue
-        status = "OK" if payload.get("healthy") else "WARN"
-        lines.append(
-            f"- {name:25s} [{status}] items={payload.get('items_last_fetch', 0)} "
-            f"latency={payload.get('latency_ms') or 0:.0f}ms last_success={payload.get('last_success')}"
-        )
-    lines.append(f"\nSnapshot generated at: {health.get('last_fetch', datetime.utcnow().isoformat())}")
+    # Only fall back to "now" when the snapshot carries no timestamp of its own
+    generated_at = health.get("last_fetch") or datetime.now(timezone.utc).isoformat()
+    lines = [
+        f"- {name:25s} [{'OK' if payload.get('healthy') else 'WARN'}] "
+        f"items={payload.get('items_last_fetch', 0)} "
+        f"latency={round(payload.get('latency_ms') or 0)}ms last_success={payload.get('last_success')}"
+        for name, payload in health.items()
+        if name != "last_fetch"
+    ]
+    lines.append(f"\nSnapshot generated at: {generated_at}")
     return "\n".join(lines)
 
 
-def _parse_markets(value: Optional[str]) -> Optional[List[str]]:
+def _parse_markets(value: Optional[str]) -> Optional[List[Market]]:
     if not value:
         return None
-    tokens = [token.strip() for token in value.split(",") if token.strip()]
-    return tokens or None
+    return Market.parse_many(value, on_unknown=_warn_unknown_market) or None
+
+
+def _dump_json(payload: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(payload, indent=2, ensure_ascii=False)
 
 
 def main() -> None:
@@ -103,31 +108,33 @@ def main() -> None:
 
     manager = NewsSourceManager(markets=_parse_markets(args.markets))
 
+    # Build the whole report, then emit it with a single write
     if args.health:
         health = manager.get_health_snapshot()
         if args.raw:
-            print(json.dumps(health, indent=2, ensure_ascii=False))
+            lines = [_dump_json(health)]
         else:
-            print("Adapter health snapshot:")
-            print(_format_health(health))
+            lines = ["Adapter health snapshot:", _format_health(health)]
+        sys.stdout.write("\n".join(lines) + "\n")
         return
 
     items = manager.get_enhanced_news_data(target_count=args.limit)
     if args.raw:
-        print(json.dumps(items, indent=2, ensure_ascii=False))
+        lines = [_dump_json(items)]
     else:
-        print(f"Fetched {len(items)} items via compatibility shim.")
+        lines = [f"Fetched {len(items)} items via compatibility shim."]
         for idx, item in enumerate(items[: min(5, len(items))], start=1):
             title = item.get("title") or "Untitled"
             source = item.get("source") or "unknown"
             market = item.get("market") or "global"
             published = item.get("publishedAt") or "n/a"
-            print(f"[{idx}] {title} ({source} · {market}) @ {published}")
+            lines.append(f"[{idx}] {title} ({source} · {market}) @ {published}")
         if not items:
-            print(
+            lines.append(
                 "\nNo news items returned. Ensure NEWS_SERVICE_API_KEY/NEWSAPI_API_KEY is set "
                 "and HorizonScanner/news_sources.yaml defines at least one adapter."
             )
+    sys.stdout.write("\n".join(lines) + "\n")
     if args.dry_run:
         return
 
@@ -1,4 +1,5 @@
-import click, yaml, pathlib
+import click
+from infra.settings import CONFIG
 from ingesters import wsj_rss
 
 @click.group()
@@ -6,8 +7,7 @@ def cli(): pass
 
 @cli.command()
 def wsj_once():
-    cfg = yaml.safe_load(pathlib.Path("config/crawler.yaml").read_text(encoding="utf-8"))
-    feeds = cfg["crawler"]["rss"]["WSJ"]["feeds"]
+    feeds = CONFIG.crawler["rss"]["WSJ"]["feeds"]
     for f in feeds:
         for it in wsj_rss.fetch(f):
             click.echo(it.model_dump_json())
@@ -1,17 +1,36 @@
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 import json
 from datetime import datetime, timezone
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup
+    _json_loads = json.loads
+
+# Input is re-encoded as UTF-8 so a stale <meta charset> in the page can't mis-decode it
+_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+_OG_TITLE = etree.XPath("(//meta[@property='og:title'])[1]")
+_OG_DESC = etree.XPath("(//meta[@property='og:description' or @name='description'])[1]")
+_LD_JSON = etree.XPath("//script[@type='application/ld+json']")
+
+def _content(tree, xpath):
+    found = xpath(tree)
+    content = found[0].get("content") if found else None
+    return content.strip() if content is not None else None
+
 def parse_og_jsonld(html: str) -> dict:
-    soup = BeautifulSoup(html, "lxml")
+    try:
+        tree = lxml_html.document_fromstring(html.encode("utf-8"), parser=_PARSER)
+    except etree.ParserError:
+        return {"title": None, "summary": None}
     out = {}
-    ogt = soup.select_one('meta[property="og:title"]')
-    ogd = soup.select_one('meta[property="og:description"], meta[name="description"]')
-    out["title"] = ogt["content"].strip() if ogt and ogt.has_attr("content") else None
-    out["summary"] = ogd["content"].strip() if ogd and ogd.has_attr("content") else None
-    for tag in soup.select('script[type="application/ld+json"]'):
+    out["title"] = _content(tree, _OG_TITLE)
+    out["summary"] = _content(tree, _OG_DESC)
+    for tag in _LD_JSON(tree):
         try:
-            data = json.loads(tag.string or "{}")
+            data = _json_loads(tag.text or "{}")
             if isinstance(data, dict) and data.get("@type") in ("Article","NewsArticle"):
                 author = data.get("author")
                 if isinstance(author, dict):
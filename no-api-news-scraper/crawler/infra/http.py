@@ -1,19 +1,42 @@
+import atexit
 import httpx, time, random
 from typing import Optional, Tuple
 
-def get_text(url: str, ua: str, timeout: int = 25,
-             etag: Optional[str] = None,
-             last_mod: Optional[str] = None) -> Tuple[str, Optional[str], Optional[str]]:
-    headers = {"User-Agent": ua}
-    if etag: headers["If-None-Match"] = etag
-    if last_mod: headers["If-Modified-Since"] = last_mod
+try:
+    import h2  # noqa: F401  # enables httpx HTTP/2 support
+    _HTTP2 = True
+except ImportError:  # fall back to pooled HTTP/1.1
+    _HTTP2 = False
+
+# One pooled client per process so repeated fetches reuse TCP/TLS connections
+_CLIENT = httpx.Client(
+    http2=_HTTP2,
+    timeout=25,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+)
+atexit.register(_CLIENT.close)
+
+def _get(url: str, headers: dict, timeout: int) -> httpx.Response:
     backoff = 1.0
     for _ in range(5):
-        r = httpx.get(url, headers=headers, timeout=timeout)
+        r = _CLIENT.get(url, headers=headers, timeout=timeout)
         if r.status_code in (429, 503):
             time.sleep(min(60, backoff) + random.random())
             backoff *= 2
             continue
         r.raise_for_status()
-        return r.text, r.headers.get("ETag"), r.headers.get("Last-Modified")
+        return r
     raise RuntimeError(f"Too many retries: {url}")
+
+def get_text(url: str, ua: str, timeout: int = 25,
+             etag: Optional[str] = None,
+             last_mod: Optional[str] = None) -> Tuple[str, Optional[str], Optional[str]]:
+    headers = {"User-Agent": ua}
+    if etag: headers["If-None-Match"] = etag
+    if last_mod: headers["If-Modified-Since"] = last_mod
+    r = _get(url, headers, timeout)
+    return r.text, r.headers.get("ETag"), r.headers.get("Last-Modified")
+
+def get_bytes(url: str, ua: str, timeout: int = 25) -> bytes:
+    """Raw body, for parsers that honour the document's own encoding declaration (XML feeds)."""
+    return _get(url, {"User-Agent": ua}, timeout).content
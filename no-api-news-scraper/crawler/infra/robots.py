@@ -1,19 +1,36 @@
+import time
 import urllib.robotparser as rp
+from collections import OrderedDict
+from urllib.parse import urlparse
 
-_cache = {}
+_MAX_ENTRIES = 256
+_TTL_SECONDS = 3600.0
+
+# robots_url -> (parser or None on read failure, expires_at); LRU-ordered, oldest first
+_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+def _read(robots_url: str):
+    parser = rp.RobotFileParser()
+    parser.set_url(robots_url)
+    try:
+        parser.read()
+    except Exception:
+        return None  # fail-open but can be adjusted per policy
+    return parser
 
 def allowed(url: str, user_agent: str) -> bool:
-    from urllib.parse import urlparse
     u = urlparse(url)
     robots_url = f"{u.scheme}://{u.netloc}/robots.txt"
-    if robots_url not in _cache:
-        parser = rp.RobotFileParser()
-        parser.set_url(robots_url)
-        try:
-            parser.read()
-        except Exception:
-            _cache[robots_url] = None
-            return True  # fail-open but can be adjusted per policy
-        _cache[robots_url] = parser
-    parser = _cache.get(robots_url)
-    return True if parser is None else parser.can_fetch(user_agent, url)
+    now = time.monotonic()
+    entry = _cache.get(robots_url)
+    if entry is None or now > entry[1]:
+        # Failed reads are cached too, but expire like any entry so the host gets retried
+        entry = (_read(robots_url), now + _TTL_SECONDS)
+        _cache[robots_url] = entry
+        if len(_cache) > _MAX_ENTRIES:
+            _cache.popitem(last=False)
+    _cache.move_to_end(robots_url)
+    parser = entry[0]
+    if parser is None:
+        return True
+    return parser.can_fetch(user_agent, url)
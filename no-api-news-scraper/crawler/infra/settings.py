@@ -1,6 +1,76 @@
+import logging
+import os
 import yaml, pathlib
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+    logging.getLogger(__name__).warning(
+        "PyYAML built without libyaml; config parsing uses the slow pure-Python loader")
+
+BASE_DIR = pathlib.Path(__file__).resolve().parents[1]
 
 def load_yaml(path: str):
     p = pathlib.Path(path)
     with p.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_Loader)
+
+@dataclass(frozen=True)
+class ScraperConfig:
+    crawler: Dict
+    playwright: Dict
+    storage: Dict
+    health: Dict
+    selectors: Dict
+
+class ConfigProvider:
+    """
+    Parses crawler.yaml + selectors.yaml once and serves the sections as attributes.
+    With EARSOFFORTUNE_CONFIG_RELOAD=1 the files' mtimes are checked on each access
+    and the config is re-read when either changes (dev hot reload); off by default.
+    """
+
+    def __init__(self, crawler_path: str = "config/crawler.yaml", selectors_path: str = "config/selectors.yaml",
+                 reload: Optional[bool] = None):
+        self._paths = (BASE_DIR / crawler_path, BASE_DIR / selectors_path)
+        self._reload = os.getenv("EARSOFFORTUNE_CONFIG_RELOAD") == "1" if reload is None else reload
+        self._stamp: Optional[Tuple[int, ...]] = None
+        self._config: Optional[ScraperConfig] = None
+
+    def _current_stamp(self) -> Tuple[int, ...]:
+        return tuple(p.stat().st_mtime_ns for p in self._paths)
+
+    def get(self) -> ScraperConfig:
+        if self._config is None or (self._reload and self._current_stamp() != self._stamp):
+            stamp = self._current_stamp()
+            cfg, selectors = (load_yaml(str(p)) for p in self._paths)
+            self._config = ScraperConfig(
+                crawler=cfg["crawler"],
+                playwright=cfg.get("playwright", {}),
+                storage=cfg.get("storage", {}),
+                health=cfg.get("healthcheck", {}),
+                selectors=selectors,
+            )
+            self._stamp = stamp
+        return self._config
+
+    @property
+    def crawler(self) -> Dict:
+        return self.get().crawler
+
+    @property
+    def selectors(self) -> Dict:
+        return self.get().selectors
+
+    @property
+    def health(self) -> Dict:
+        return self.get().health
+
+    @property
+    def playwright(self) -> Dict:
+        return self.get().playwright
+
+CONFIG = ConfigProvider()
@@ -0,0 +1,87 @@
+"""
+lxml-backed RSS 2.0 / Atom parser exposing the slice of feedparser's result
+surface the scraper relies on: ``parse(...).entries`` with ``title``, ``link``,
+``author``, ``summary`` and ``published_parsed``. ``iter_entries`` yields the
+same entries from a file object without holding the whole tree.
+"""
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from types import SimpleNamespace
+from typing import BinaryIO, Iterator, Optional, Union
+
+from lxml import etree
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_DC_CREATOR = "{http://purl.org/dc/elements/1.1/}creator"
+
+# Bytes honour the document's encoding declaration; str input is re-encoded as UTF-8 and parsed as such
+_BYTES_PARSER = etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
+_TEXT_PARSER = etree.XMLParser(recover=True, resolve_entities=False, no_network=True, encoding="utf-8")
+
+
+def _struct_time(value: Optional[str]) -> Optional[time.struct_time]:
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        dt = parsedate_to_datetime(value)  # RSS pubDate (RFC 822)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))  # Atom (RFC 3339)
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).timetuple()
+
+
+def _rss_entry(node) -> SimpleNamespace:
+    return SimpleNamespace(
+        title=node.findtext("title"),
+        link=node.findtext("link"),
+        author=node.findtext("author") or node.findtext(_DC_CREATOR),
+        summary=node.findtext("description"),
+        published_parsed=_struct_time(node.findtext("pubDate")),
+    )
+
+
+def _atom_entry(node) -> SimpleNamespace:
+    link = None
+    for candidate in node.iterfind(_ATOM + "link"):
+        if candidate.get("rel", "alternate") == "alternate":
+            link = candidate.get("href")
+            break
+    return SimpleNamespace(
+        title=node.findtext(_ATOM + "title"),
+        link=link,
+        author=node.findtext(f"{_ATOM}author/{_ATOM}name"),
+        summary=node.findtext(_ATOM + "summary") or node.findtext(_ATOM + "content"),
+        published_parsed=_struct_time(node.findtext(_ATOM + "published") or node.findtext(_ATOM + "updated")),
+    )
+
+
+def parse(data: Union[str, bytes]) -> SimpleNamespace:
+    if isinstance(data, str):
+        root = etree.fromstring(data.encode("utf-8"), _TEXT_PARSER) if data.strip() else None
+    else:
+        root = etree.fromstring(data, _BYTES_PARSER) if data.strip() else None
+    if root is None:
+        return SimpleNamespace(entries=[])
+    entries = [
+        _rss_entry(node) if node.tag == "item" else _atom_entry(node)
+        for node in root.iter("item", _ATOM + "entry")
+    ]
+    return SimpleNamespace(entries=entries)
+
+
+def iter_entries(source: Union[str, BinaryIO]) -> Iterator[SimpleNamespace]:
+    for _, node in etree.iterparse(
+        source, events=("end",), tag=("item", _ATOM + "entry"),
+        recover=True, resolve_entities=False, no_network=True,
+    ):
+        yield _rss_entry(node) if node.tag == "item" else _atom_entry(node)
+        # Free each entry once read so long feeds stream in bounded memory
+        node.clear()
+        while node.getprevious() is not None:
+            del node.getparent()[0]
@@ -1,19 +1,30 @@
-import feedparser
+import calendar
+import io
 from datetime import datetime, timezone
 from schemas.models import ArticleItem
 from extractors.clean import clip
+from infra.http import get_bytes
+from ingesters import rss_fast
 
-def _dt(e):
-    return datetime(*e.published_parsed[:6], tzinfo=timezone.utc) if getattr(e, "published_parsed", None) else None
+DEFAULT_UA = "NewsCollector/1.0 (+contact@example.com)"
 
-def fetch(feed_url: str):
-    feed = feedparser.parse(feed_url)
-    for e in feed.entries:
+def _dt(parsed):
+    # rss_fast normalises dates to UTC struct_time, same as feedparser's published_parsed
+    return datetime.fromtimestamp(calendar.timegm(parsed), timezone.utc) if parsed else None
+
+def _open(feed_url):
+    # libxml2 can't fetch https itself; local paths and file objects are parsed directly
+    if isinstance(feed_url, str) and feed_url.startswith(("http://", "https://")):
+        return io.BytesIO(get_bytes(feed_url, DEFAULT_UA))
+    return feed_url
+
+def fetch(feed_url):
+    for entry in rss_fast.iter_entries(_open(feed_url)):
         yield ArticleItem(
             source="WSJ",
-            title=e.title,
-            url=e.link,
-            author=getattr(e, "author", None),
-            published_at=_dt(e),
-            summary=clip(getattr(e, "summary", None), 800)
+            title=(entry.title or "").strip(),
+            url=(entry.link or "").strip(),
+            author=entry.author,
+            published_at=_dt(entry.published_parsed),
+            summary=clip(entry.summary, 800)
         )
@@ -1,36 +1,67 @@
 from sqlalchemy import create_engine, text
 
+_CREATE_ARTICLES = text("""
+CREATE TABLE IF NOT EXISTS articles (
+  url TEXT PRIMARY KEY,
+  source TEXT, title TEXT, author TEXT,
+  published_at TIMESTAMP, summary TEXT, topics TEXT
+);""")
+
+_UPSERT_ARTICLE = text("""
+INSERT INTO articles (url,source,title,author,published_at,summary,topics)
+VALUES (:url,:source,:title,:author,:published_at,:summary,:topics)
+ON CONFLICT(url) DO UPDATE SET title=excluded.title, summary=excluded.summary
+""")
+
+_CREATE_POSTS = text("""
+CREATE TABLE IF NOT EXISTS social_posts (
+  platform TEXT, post_id TEXT,
+  user_handle TEXT, url TEXT,
+  posted_at TIMESTAMP, text_snippet TEXT, metrics TEXT, topics TEXT,
+  PRIMARY KEY (platform, post_id)
+);""")
+
+_UPSERT_POST = text("""
+INSERT INTO social_posts (platform,post_id,user_handle,url,posted_at,text_snippet,metrics,topics)
+VALUES (:platform,:post_id,:user_handle,:url,:posted_at,:text_snippet,:metrics,:topics)
+ON CONFLICT(platform,post_id) DO UPDATE SET text_snippet=excluded.text_snippet
+""")
+
+def _article_row(it):
+    return {**it.model_dump(), "topics": ",".join(it.topics)}
+
+def _post_row(it):
+    return {**it.model_dump(), "metrics": str(it.metrics), "topics": ",".join(it.topics)}
+
 class Store:
     def __init__(self, db_url: str):
         self.engine = create_engine(db_url, future=True)
+        # Each table is created at most once per Store, on first write
+        self._articles_ready = False
+        self._posts_ready = False
 
     def upsert_article(self, it):
-        sql = text("""
-        CREATE TABLE IF NOT EXISTS articles (
-          url TEXT PRIMARY KEY,
-          source TEXT, title TEXT, author TEXT,
-          published_at TIMESTAMP, summary TEXT, topics TEXT
-        );""")
+        self.upsert_articles([it])
+
+    def upsert_articles(self, items):
+        rows = [_article_row(it) for it in items]
+        if not rows:
+            return
         with self.engine.begin() as cx:
-            cx.execute(sql)
-            cx.execute(text("""
-            INSERT INTO articles (url,source,title,author,published_at,summary,topics)
-            VALUES (:url,:source,:title,:author,:published_at,:summary,:topics)
-            ON CONFLICT(url) DO UPDATE SET title=excluded.title, summary=excluded.summary
-            """), {**it.model_dump(), "topics": ",".join(it.topics)})
+            if not self._articles_ready:
+                cx.execute(_CREATE_ARTICLES)
+            cx.execute(_UPSERT_ARTICLE, rows)  # list of params -> executemany, one transaction
+        self._articles_ready = True
 
     def upsert_post(self, it):
-        sql = text("""
-        CREATE TABLE IF NOT EXISTS social_posts (
-          platform TEXT, post_id TEXT,
-          user_handle TEXT, url TEXT,
-          posted_at TIMESTAMP, text_snippet TEXT, metrics TEXT, topics TEXT,
-          PRIMARY KEY (platform, post_id)
-        );""")
+        self.upsert_posts([it])
+
+    def upsert_posts(self, items):
+        rows = [_post_row(it) for it in items]
+        if not rows:
+            return
         with self.engine.begin() as cx:
-            cx.execute(sql)
-            cx.execute(text("""
-            INSERT INTO social_posts (platform,post_id,user_handle,url,posted_at,text_snippet,metrics,topics)
-            VALUES (:platform,:post_id,:user_handle,:url,:posted_at,:text_snippet,:metrics,:topics)
-            ON CONFLICT(platform,post_id) DO UPDATE SET text_snippet=excluded.text_snippet
-            """), {**it.model_dump(), "metrics": str(it.metrics), "topics": ",".join(it.topics)})
+            if not self._posts_ready:
+                cx.execute(_CREATE_POSTS)
+            cx.execute(_UPSERT_POST, rows)
+        self._posts_ready = True
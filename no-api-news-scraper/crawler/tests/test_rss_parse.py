@@ -1,24 +1,25 @@
-import time
-from types import SimpleNamespace
+import io
 
-from ingesters import wsj_rss
+from ingesters import rss_fast, wsj_rss
 
+SAMPLE_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel>
+    <title>WSJ</title>
+    <item>
+      <title>Sample Headline</title>
+      <link>https://example.com/a</link>
+      <dc:creator>Reporter</dc:creator>
+      <description>Short summary</description>
+      <pubDate>Tue, 02 Jan 2024 03:04:05 GMT</pubDate>
+    </item>
+  </channel>
+</rss>
+"""
 
-def test_wsj_rss_fetch_parses_entry(monkeypatch):
-    entry = SimpleNamespace(
-        title="Sample Headline",
-        link="https://example.com/a",
-        author="Reporter",
-        summary="Short summary",
-        published_parsed=time.struct_time((2024, 1, 2, 3, 4, 5, 1, 2, -1)),
-    )
 
-    def fake_parse(_):
-        return SimpleNamespace(entries=[entry])
-
-    monkeypatch.setattr(wsj_rss.feedparser, "parse", fake_parse)
-
-    items = list(wsj_rss.fetch("dummy-url"))
+def test_wsj_rss_fetch_parses_entry():
+    items = list(wsj_rss.fetch(io.BytesIO(SAMPLE_FEED)))
     assert len(items) == 1
     article = items[0]
     assert article.source == "WSJ"
@@ -26,3 +27,14 @@ def test_wsj_rss_fetch_parses_entry(monkeypatch):
     assert article.url == "https://example.com/a"
     assert article.author == "Reporter"
     assert article.summary == "Short summary"
+
+
+def test_rss_fast_parse_exposes_feedparser_fields():
+    entries = rss_fast.parse(SAMPLE_FEED.decode("utf-8")).entries
+    assert len(entries) == 1
+    entry = entries[0]
+    assert entry.title == "Sample Headline"
+    assert entry.link == "https://example.com/a"
+    assert entry.author == "Reporter"
+    assert entry.summary == "Short summary"
+    assert tuple(entry.published_parsed[:6]) == (2024, 1, 2, 3, 4, 5)
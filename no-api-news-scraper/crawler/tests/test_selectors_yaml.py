@@ -1,8 +1,7 @@
-import yaml, pathlib
+from infra.settings import CONFIG
 
 def test_selectors_yaml_loads():
-    p = pathlib.Path("config/selectors.yaml")
-    data = yaml.safe_load(p.read_text(encoding="utf-8"))
+    data = CONFIG.selectors
     assert "x" in data and "truth" in data
     for k in ("article","link_contains","time"):
         assert k in data["x"]
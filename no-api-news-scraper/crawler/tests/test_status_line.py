@@ -1,9 +1,12 @@
+import threading
+
+from infra.settings import ScraperConfig
 from tools import doctor
 
 
 def test_doctor_collect_status(monkeypatch):
-    sample_cfg = {
-        "crawler": {
+    sample_cfg = ScraperConfig(
+        crawler={
             "user_agent": "UA",
             "timeout_sec": 5,
             "per_domain_min_interval_sec": 0.1,
@@ -17,23 +20,21 @@ def test_doctor_collect_status(monkeypatch):
                 "X": {"enabled": True, "handles": ["realDonaldTrump"]},
             },
         },
-        "playwright": {"browser": "firefox", "headless": True, "wait_after_load_sec": 0.1},
-        "healthcheck": {"rss_sample_limit": 1, "truth_sample_limit": 1, "x_sample_limit": 1},
-    }
-    selectors_cfg = {
-        "truth": {"article": "article", "link_contains": "/post/", "time": "time"},
-        "x": {"article": "article", "link_contains": "/status/", "time": "time"},
-    }
-
-    def fake_load_yaml(path):
-        return selectors_cfg if "selectors" in path else sample_cfg
-
-    monkeypatch.setattr(doctor, "load_yaml", fake_load_yaml)
+        playwright={"browser": "firefox", "headless": True, "article_wait_timeout_sec": 0.1},
+        storage={},
+        health={"rss_sample_limit": 1, "truth_sample_limit": 1, "x_sample_limit": 1},
+        selectors={
+            "truth": {"article": "article", "link_contains": "/post/", "time": "time"},
+            "x": {"article": "article", "link_contains": "/status/", "time": "time"},
+        },
+    )
+
+    monkeypatch.setattr(doctor, "CONFIG", sample_cfg)
     monkeypatch.setattr(doctor, "check_rss", lambda *args, **kwargs: (True, ["rss ok"]))
     monkeypatch.setattr(doctor, "check_truth", lambda *args, **kwargs: (True, ["truth ok"]))
     monkeypatch.setattr(doctor, "check_x", lambda *args, **kwargs: (True, ["x ok"]))
 
-    status = doctor.collect_status()
+    status = doctor.collect_status(force_refresh=True)
 
     assert status["rss"] == {"WSJ": True, "Bloomberg": True, "Financial Times": True}
     assert status["truth"] == {"realDonaldTrump": True}
@@ -41,3 +42,44 @@ def test_doctor_collect_status(monkeypatch):
     assert "rss ok" in status["details"]
     assert "truth ok" in status["details"]
     assert "x ok" in status["details"]
+
+
+def test_doctor_shutdown_closes_browser_on_playwright_thread(monkeypatch):
+    events = []
+
+    class FakeBrowser:
+        def is_connected(self):
+            return True
+
+        def close(self):
+            events.append(("browser.close", threading.get_ident()))
+
+    class FakePlaywright:
+        def stop(self):
+            events.append(("playwright.stop", threading.get_ident()))
+
+    def fake_launch(key):
+        events.append(("launch", threading.get_ident()))
+        return FakePlaywright(), FakeBrowser()
+
+    monkeypatch.setattr(doctor, "_launch_browser", fake_launch)
+    cfg = {"browser": "firefox", "headless": True}
+
+    def job(browser, tag):
+        return tag, threading.get_ident()
+
+    results = doctor._check_handles(
+        lambda handle, selectors, playwright_cfg, sample: doctor._PLAYWRIGHT.run(playwright_cfg, job, handle),
+        ["a", "b", "c"], {}, cfg, 1,
+    )
+    doctor.shutdown()
+
+    # One warm browser served every job, on one thread, and was closed on that same thread
+    (launch_thread,) = {ident for _, ident in results}
+    assert [tag for tag, _ in results] == ["a", "b", "c"]
+    assert events == [
+        ("launch", launch_thread),
+        ("browser.close", launch_thread),
+        ("playwright.stop", launch_thread),
+    ]
+    assert doctor._social_executor is None
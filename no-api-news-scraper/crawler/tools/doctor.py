@@ -1,104 +1,329 @@
+import asyncio
+import atexit
+import queue
+import threading
 import time
-from pathlib import Path
-from typing import Dict, List, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
-import feedparser
 import httpx
-import yaml
 
+from infra.settings import CONFIG
+from tools.throttle import DomainRateLimiter
 
-BASE_DIR = Path(__file__).resolve().parents[1]
+try:
+    from ingesters import rss_fast as feed_parser  # lxml-backed, same .entries surface
+except ImportError:  # lxml unavailable
+    import feedparser as feed_parser
 
+try:
+    import h2  # noqa: F401  # enables httpx HTTP/2 support
+    _HTTP2 = True
+except ImportError:  # fall back to HTTP/1.1
+    _HTTP2 = False
 
-def load_yaml(path: str):
-    target = Path(path)
-    if not target.is_absolute():
-        target = BASE_DIR / target
-    return yaml.safe_load(target.read_text(encoding="utf-8"))
+_RSS_CONCURRENCY = 8
+# Feeds of one source tend to share CDN hosts; keep their connections alive across the batch
+_RSS_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=8)
+# feed url -> (ETag, Last-Modified, entry count) from its last 200, for conditional re-checks
+_FEED_VALIDATORS: Dict[str, Tuple[Optional[str], Optional[str], int]] = {}
 
 
-def _respect_delay(domain: str, min_delay: float, tracker: Dict[str, float]):
-    import time as _time
+async def _check_rss_async(name: str, feeds: List[str], user_agent: str, timeout: int, min_delay: float, sample: int = 3) -> Tuple[bool, List[str]]:
+    limiter = DomainRateLimiter(min_delay)
+    semaphore = asyncio.Semaphore(_RSS_CONCURRENCY)
 
-    last = tracker.get(domain)
-    now = _time.time()
-    if last and now - last < min_delay:
-        _time.sleep(min_delay - (now - last))
-    tracker[domain] = _time.time()
+    async def check_feed(client: httpx.AsyncClient, url: str) -> Tuple[bool, str]:
+        try:
+            await limiter.wait(urlparse(url).netloc)
+            headers = {}
+            cached = _FEED_VALIDATORS.get(url)
+            if cached is not None:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+            async with semaphore:
+                response = await client.get(url, headers=headers)
+            if response.status_code == 304 and cached is not None:
+                # Unchanged since the last successful check: reuse its entry count, skip the parse
+                n_entries = cached[2]
+                return min(sample, n_entries) > 0, f"{name} feed ok (304): {url} (entries={n_entries})"
+            response.raise_for_status()
+            # Parsing is CPU-bound; keep it off the event loop so other fetches progress.
+            # Raw bytes let the parser honour the XML encoding declaration without a decode/re-encode
+            feed = await asyncio.to_thread(feed_parser.parse, response.content)
+            n_entries = len(getattr(feed, "entries", []))
+            etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+            if etag or last_modified:
+                _FEED_VALIDATORS[url] = (etag, last_modified, n_entries)
+            else:
+                _FEED_VALIDATORS.pop(url, None)
+            return min(sample, n_entries) > 0, f"{name} feed ok: {url} (entries={n_entries})"
+        except Exception as exc:
+            return False, f"{name} feed FAIL: {url} -> {exc}"
+
+    async with httpx.AsyncClient(
+        headers={"User-Agent": user_agent}, timeout=timeout, http2=_HTTP2, limits=_RSS_LIMITS
+    ) as client:
+        results = await asyncio.gather(*(check_feed(client, url) for url in feeds))
+    return all(ok for ok, _ in results), [msg for _, msg in results]
 
 
 def check_rss(name: str, feeds: List[str], user_agent: str, timeout: int, min_delay: float, sample: int = 3) -> Tuple[bool, List[str]]:
-    ok = True
-    msgs: List[str] = []
-    headers = {"User-Agent": user_agent}
-    delay_tracker: Dict[str, float] = {}
+    """Check all feeds of one source concurrently; results keep the order of ``feeds``."""
+    return asyncio.run(_check_rss_async(name, feeds, user_agent, timeout, min_delay, sample))
+
+
+def _launch_browser(key: Tuple[str, bool]):
+    from playwright.sync_api import sync_playwright
+
+    playwright = sync_playwright().start()
+    try:
+        return playwright, getattr(playwright, key[0]).launch(headless=key[1])
+    except BaseException:
+        playwright.stop()
+        raise
+
+
+def _close_browser(playwright, browser) -> None:
+    try:
+        if browser is not None:
+            browser.close()
+    except Exception:
+        pass  # already disconnected
+    try:
+        if playwright is not None:
+            playwright.stop()
+    except Exception:
+        pass  # driver already gone
 
-    for url in feeds:
+
+class _PlaywrightThread:
+    """
+    One dedicated daemon thread owns Playwright and a single warm browser (sync
+    Playwright objects must stay on the thread that created them); social checks
+    hand it jobs and wait for the result. Each job gets a fresh BrowserContext, so
+    no cookies or storage leak between handles. The thread closes the browser and
+    its driver itself, in a ``finally``, when stopped.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._jobs: Optional[queue.Queue] = None
+
+    def run(self, playwright_cfg: Dict[str, object], fn: Callable, *args):
+        """Call ``fn(browser, *args)`` on the Playwright thread and return its result."""
+        key = (playwright_cfg["browser"], bool(playwright_cfg["headless"]))
+        future: Future = Future()
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                # Each thread gets its own queue so a stop sentinel never reaches its successor
+                self._jobs = queue.Queue()
+                self._thread = threading.Thread(
+                    target=self._serve, args=(self._jobs,), name="doctor-playwright", daemon=True
+                )
+                self._thread.start()
+            self._jobs.put((future, key, fn, args))
+        return future.result()
+
+    def stop(self, timeout: float) -> None:
+        with self._lock:
+            thread, jobs = self._thread, self._jobs
+            self._thread = self._jobs = None
+        if thread is not None and thread.is_alive():
+            jobs.put(None)
+            thread.join(timeout)
+
+    @staticmethod
+    def _serve(jobs: queue.Queue) -> None:
+        playwright = browser = key = None
         try:
-            from urllib.parse import urlparse
+            while True:
+                job = jobs.get()
+                if job is None:
+                    return
+                future, wanted, fn, args = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    if browser is None or key != wanted or not browser.is_connected():
+                        _close_browser(playwright, browser)
+                        playwright = browser = None
+                        playwright, browser = _launch_browser(wanted)
+                        key = wanted
+                    future.set_result(fn(browser, *args))
+                except BaseException as exc:
+                    future.set_exception(exc)
+        finally:
+            _close_browser(playwright, browser)
 
-            domain = urlparse(url).netloc
-            _respect_delay(domain, min_delay, delay_tracker)
 
-            response = httpx.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()
-            feed = feedparser.parse(response.text)
-            n_entries = len(getattr(feed, "entries", []))
-            msgs.append(f"{name} feed ok: {url} (entries={n_entries})")
-            ok = ok and (min(sample, n_entries) > 0)
-        except Exception as exc:
-            msgs.append(f"{name} feed FAIL: {url} -> {exc}")
-            ok = False
-    return ok, msgs
+_PLAYWRIGHT = _PlaywrightThread()
+
+
+_ARTICLE_WAIT_SEC = 10.0
+
+
+def _count_cards(url: str, selectors: Dict[str, str], playwright_cfg: Dict[str, object], sample: int) -> int:
+    return _PLAYWRIGHT.run(playwright_cfg, _count_cards_in, url, selectors, playwright_cfg, sample)
+
+
+def _count_cards_in(browser, url: str, selectors: Dict[str, str], playwright_cfg: Dict[str, object], sample: int) -> int:
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    ctx = browser.new_context()
+    try:
+        page = ctx.new_page()
+        page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        articles = page.locator(selectors["article"])
+        # Returns as soon as the first card renders instead of sleeping a fixed delay
+        timeout_ms = float(playwright_cfg.get("article_wait_timeout_sec", _ARTICLE_WAIT_SEC)) * 1000
+        try:
+            articles.first.wait_for(state="visible", timeout=timeout_ms)
+        except PlaywrightTimeoutError:
+            return 0
+        return len(articles.all()[:sample])
+    finally:
+        ctx.close()
+
+
+_PROBE_TIMEOUT_SEC = 5.0
+_PROBE_NEGATIVE_TTL_SEC = 60.0
+_PROBE_UA = "Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0"
+# Status codes bot walls answer with; they say nothing about the profile itself
+_PROBE_CHALLENGE_CODES = frozenset({401, 403, 429, 503})
+# url -> monotonic expiry of a recent definite failure
+_probe_failures: Dict[str, float] = {}
+_probe_lock = threading.Lock()
+
+
+def _cheap_probe(url: str, marker: str) -> Optional[bool]:
+    """
+    Plain HTTP liveness check ahead of a browser render: True when the page
+    already links posts (``marker`` in the body), False on a definite HTTP or
+    network failure, None when only a rendered page can tell (JS shell, bot wall).
+    """
+    with _probe_lock:
+        expires = _probe_failures.get(url)
+        if expires is not None and time.monotonic() < expires:
+            return False
+    try:
+        response = httpx.get(url, headers={"User-Agent": _PROBE_UA}, follow_redirects=True, timeout=_PROBE_TIMEOUT_SEC)
+    except httpx.HTTPError:
+        result: Optional[bool] = False
+    else:
+        if response.status_code in _PROBE_CHALLENGE_CODES:
+            result = None
+        elif response.is_error:
+            result = False
+        else:
+            result = True if marker in response.text else None
+    if result is False:
+        with _probe_lock:
+            _probe_failures[url] = time.monotonic() + _PROBE_NEGATIVE_TTL_SEC
+    return result
 
 
 def check_truth(handle: str, selectors: Dict[str, str], playwright_cfg: Dict[str, object], sample: int = 3):
+    url = f"https://truthsocial.com/@{handle}"
     try:
-        from playwright.sync_api import sync_playwright
-
-        with sync_playwright() as p:
-            browser = getattr(p, playwright_cfg["browser"]).launch(headless=playwright_cfg["headless"])
-            ctx = browser.new_context()
-            page = ctx.new_page()
-            page.goto(f"https://truthsocial.com/@{handle}", wait_until="domcontentloaded", timeout=30000)
-            time.sleep(playwright_cfg["wait_after_load_sec"])
-            cards = page.locator(selectors["article"]).all()[:sample]
-            ok = len(cards) > 0
-            ctx.close()
-            browser.close()
-        return ok, [f"Truth @{handle} cards={len(cards)}"]
+        probe = _cheap_probe(url, selectors["link_contains"])
+        if probe is not None:
+            return probe, [f"Truth @{handle} http probe {'ok' if probe else 'FAIL'}"]
+        cards = _count_cards(url, selectors, playwright_cfg, sample)
+        return cards > 0, [f"Truth @{handle} cards={cards}"]
     except Exception as exc:
         return False, [f"Truth @{handle} FAIL -> {exc}"]
 
 
 def check_x(handle: str, selectors: Dict[str, str], playwright_cfg: Dict[str, object], sample: int = 3):
+    url = f"https://x.com/{handle}"
     try:
-        from playwright.sync_api import sync_playwright
-
-        with sync_playwright() as p:
-            browser = getattr(p, playwright_cfg["browser"]).launch(headless=playwright_cfg["headless"])
-            ctx = browser.new_context()
-            page = ctx.new_page()
-            page.goto(f"https://x.com/{handle}", wait_until="domcontentloaded", timeout=30000)
-            time.sleep(playwright_cfg["wait_after_load_sec"])
-            cards = page.locator(selectors["article"]).all()[:sample]
-            ok = len(cards) > 0
-            ctx.close()
-            browser.close()
-        return ok, [f"X @{handle} cards={len(cards)}"]
+        probe = _cheap_probe(url, selectors["link_contains"])
+        if probe is not None:
+            return probe, [f"X @{handle} http probe {'ok' if probe else 'FAIL'}"]
+        cards = _count_cards(url, selectors, playwright_cfg, sample)
+        return cards > 0, [f"X @{handle} cards={cards}"]
     except Exception as exc:
         return False, [f"X @{handle} FAIL -> {exc}"]
 
 
-def collect_status() -> Dict[str, object]:
-    cfg = load_yaml("config/crawler.yaml")
-    selectors = load_yaml("config/selectors.yaml")
+_SOCIAL_PARALLEL = 3
+_SHUTDOWN_TIMEOUT_SEC = 10.0
+_social_executor: Optional[ThreadPoolExecutor] = None
+_social_lock = threading.Lock()
+
+
+def _check_handles(check: Callable, handles: List[str], selectors: Dict[str, str], playwright_cfg: Dict[str, object], sample: int):
+    """Run ``check`` for every handle concurrently; results are returned in handle order."""
+    global _social_executor
+    if not handles:
+        return []
+    # Workers run the HTTP probes in parallel; browser renders queue on the Playwright thread
+    with _social_lock:
+        if _social_executor is None:
+            _social_executor = ThreadPoolExecutor(max_workers=_SOCIAL_PARALLEL, thread_name_prefix="doctor-social")
+        executor = _social_executor
+    return list(executor.map(lambda handle: check(handle, selectors, playwright_cfg, sample), handles))
+
+
+def shutdown() -> None:
+    """Stop the social workers, then the Playwright thread (which closes its browser and driver)."""
+    global _social_executor
+    with _social_lock:
+        executor, _social_executor = _social_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+    _PLAYWRIGHT.stop(_SHUTDOWN_TIMEOUT_SEC)
+
+
+atexit.register(shutdown)
+
+
+_STATUS_TTL_SECONDS = 60.0
+_status_cache: Dict[str, object] = {"ts": 0.0, "value": None}
+_status_lock = threading.Lock()
+
+
+def _cached_status(ttl: float):
+    value = _status_cache["value"]
+    if value is not None and time.monotonic() - _status_cache["ts"] < ttl:
+        return value
+    return None
+
+
+def collect_status(force_refresh: bool = False, ttl: float = _STATUS_TTL_SECONDS) -> Dict[str, object]:
+    """Health report for all sources; probes run at most once per ``ttl`` seconds unless forced."""
+    if not force_refresh:
+        cached = _cached_status(ttl)
+        if cached is not None:
+            return cached
+    # One probe at a time: concurrent dashboard hits wait for it instead of launching their own
+    with _status_lock:
+        if not force_refresh:
+            cached = _cached_status(ttl)
+            if cached is not None:
+                return cached
+        report = _collect_status()
+        _status_cache["ts"] = time.monotonic()
+        _status_cache["value"] = report
+    return report
+
+
+def _collect_status() -> Dict[str, object]:
+    # Parsed once per process by the shared provider; treat the sections as read-only
+    crawler_cfg = CONFIG.crawler
+    playwright_cfg = CONFIG.playwright
+    health_cfg = CONFIG.health
+    selectors = CONFIG.selectors
     report: Dict[str, object] = {"deepseek_configured": True}
 
     rss_status: Dict[str, bool] = {}
     rss_msgs: List[str] = []
-    crawler_cfg = cfg["crawler"]
-    health_cfg = cfg["healthcheck"]
 
     for name, node in crawler_cfg["rss"].items():
         label = "Financial Times" if name == "FinancialTimes" else name
@@ -122,8 +347,9 @@ def collect_status() -> Dict[str, object]:
     truth_msgs: List[str] = []
     truth_cfg = crawler_cfg["social"]["TruthSocial"]
     if truth_cfg.get("enabled"):
-        for handle in truth_cfg.get("handles", []):
-            ok, msgs = check_truth(handle, selectors["truth"], cfg["playwright"], health_cfg["truth_sample_limit"])
+        handles = truth_cfg.get("handles", [])
+        results = _check_handles(check_truth, handles, selectors["truth"], playwright_cfg, health_cfg["truth_sample_limit"])
+        for handle, (ok, msgs) in zip(handles, results):
             truth_status[handle] = ok
             truth_msgs.extend(msgs)
     report["truth"] = truth_status
@@ -132,8 +358,9 @@ def collect_status() -> Dict[str, object]:
     x_msgs: List[str] = []
     x_cfg = crawler_cfg["social"]["X"]
     if x_cfg.get("enabled"):
-        for handle in x_cfg.get("handles", []):
-            ok, msgs = check_x(handle, selectors["x"], cfg["playwright"], health_cfg["x_sample_limit"])
+        handles = x_cfg.get("handles", [])
+        results = _check_handles(check_x, handles, selectors["x"], playwright_cfg, health_cfg["x_sample_limit"])
+        for handle, (ok, msgs) in zip(handles, results):
             x_status[handle] = ok
             x_msgs.extend(msgs)
     report["twitter"] = x_status
@@ -143,7 +370,10 @@ def collect_status() -> Dict[str, object]:
 
 
 def main():
-    status = collect_status()
+    try:
+        status = collect_status()
+    finally:
+        shutdown()
     print("API Status Check:")
     print(f"  DeepSeek configured: {status['deepseek_configured']}")
     print(f"  RSS sources: {status['rss']}")
@@ -0,0 +1,24 @@
+import asyncio
+import time
+from typing import Dict
+
+
+class DomainRateLimiter:
+    """Async per-domain spacing: at most one request per ``min_interval`` seconds to each domain."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        # domain -> monotonic time of the latest reserved request slot
+        self._last: Dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    async def wait(self, domain: str) -> None:
+        # Only the slot reservation is locked; the sleep happens after release, so
+        # callers for other domains (and later slots for this one) are never blocked by it
+        async with self._lock:
+            now = time.monotonic()
+            last = self._last.get(domain)
+            wait = 0.0 if last is None else max(0.0, self.min_interval - (now - last))
+            self._last[domain] = now + wait
+        if wait:
+            await asyncio.sleep(wait)
@@ -1,3 +1,5 @@
+import argparse
+import importlib
 import os
 
 try:
@@ -9,27 +11,54 @@ if load_dotenv:
     dotenv_path = os.getenv('EARSOFFORTUNE_DOTENV', '.env')
     load_dotenv(dotenv_path)
 
-from app import app
 
-if __name__ == '__main__':
-    # Set default host and port
-    host = os.getenv('HOST', '127.0.0.1')
-    port = int(os.getenv('PORT', 5000))
+def _load_app_module(spec: str):
+    """Resolve a ``module:attribute`` spec (Flask convention) to ``(module, app)``."""
+    module_name, _, attr = spec.partition(':')
+    module = importlib.import_module(module_name)
+    return module, getattr(module, attr or 'app')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Start the HorizonScanner web app.")
+    parser.add_argument('--host', default=os.getenv('HOST', '127.0.0.1'))
+    parser.add_argument('--port', type=int, default=int(os.getenv('PORT', 5000)))
+    parser.add_argument('--health', action='store_true', help="print the no-API source health before starting")
+    parser.add_argument('--force-health', action='store_true', help="like --health, but bypass the cached snapshot")
+    args = parser.parse_args(argv)
     debug = os.getenv('DEBUG', 'False').lower() == 'true'
-    
-    print(f"Starting HorizonScanner on {host}:{port}")
+
+    # The app module pulls in the news pipeline, doctor and friends; import it only when serving
+    module, app = _load_app_module(os.getenv('EARSOFFORTUNE_APP', 'app:app'))
+
+    print(f"Starting HorizonScanner on {args.host}:{args.port}")
     print("API Status Check:")
-    
+
     # Load environment variables and check API keys (without hardcoded sample comparisons)
-    from app import DEEPSEEK_API_KEY
-    deepseek_configured = bool(DEEPSEEK_API_KEY) and 'YOUR_' not in str(DEEPSEEK_API_KEY)
-    
+    deepseek_api_key = getattr(module, 'DEEPSEEK_API_KEY', None)
+    deepseek_configured = bool(deepseek_api_key) and 'YOUR_' not in str(deepseek_api_key)
+
     print(f"  DeepSeek configured: {deepseek_configured}")
-    
+
     if not deepseek_configured:
         print("\n[WARN] DeepSeek key missing; downstream analysis features will use fallbacks.")
-    
-    print(f"\nAccess URL: http://{host}:{port}")
+
+    if args.health or args.force_health:
+        snapshot_fn = getattr(module, 'get_no_api_health_snapshot', None)
+        snapshot = snapshot_fn(force_refresh=args.force_health) if snapshot_fn else None
+        if not snapshot:
+            print("  No-API health: unavailable")
+        elif 'error' in snapshot:
+            print(f"  No-API health: error -> {snapshot['error']}")
+        else:
+            print(f"  No-API RSS: {snapshot.get('rss')}")
+            print(f"  No-API Truth: {snapshot.get('truth')}  X ready: {snapshot.get('twitter_ready')}")
+
+    print(f"\nAccess URL: http://{args.host}:{args.port}")
     print("Frontend will show 'Loading news data' and connection status")
-    
-    app.run(host=host, port=port, debug=debug, threaded=True)
+
+    app.run(host=args.host, port=args.port, debug=debug, threaded=True)
+
+
+if __name__ == '__main__':
+    main()
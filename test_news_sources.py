@@ -3,6 +3,8 @@ Test script for the enhanced news source management module
 """
 import os
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add the project root to the Python path
@@ -42,14 +44,8 @@ def test_news_source_manager():
             print(f"   Description: {article['description'][:100]}...")
         
         # Show source breakdown
-        source_counts = {}
-        type_counts = {}
-        for article in results:
-            source = article['source']
-            content_type = article['contentType']
-            
-            source_counts[source] = source_counts.get(source, 0) + 1
-            type_counts[content_type] = type_counts.get(content_type, 0) + 1
+        source_counts = Counter(article['source'] for article in results)
+        type_counts = Counter(article['contentType'] for article in results)
         
         print(f"\n--- Source Breakdown ---")
         for source, count in source_counts.items():
@@ -70,9 +66,14 @@ def test_original_vs_enhanced():
     # Import the main application to test both methods
     from ears_of_fortune_v2 import get_news_safe_original
     
+    # Both paths are I/O bound, so fetch them side by side and report in order
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        original_future = executor.submit(get_news_safe_original)
+        enhanced_future = executor.submit(get_news, [Market.GLOBAL, Market.US])
+    
     print("Testing original implementation...")
     try:
-        original_results = get_news_safe_original()
+        original_results = original_future.result()
         print(f"Original implementation returned {len(original_results)} articles")
     except Exception as e:
         print(f"Error in original implementation: {e}")
@@ -81,7 +82,7 @@ def test_original_vs_enhanced():
     
     print("\nTesting enhanced implementation...")
     try:
-        pipeline_result = get_news([Market.GLOBAL, Market.US])
+        pipeline_result = enhanced_future.result()
         enhanced_results = [
             {
                 "title": item.title,
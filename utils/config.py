@@ -1,4 +1,6 @@
 import os
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 
 
 def get_int_env(name: str, default: int) -> int:
@@ -9,20 +11,48 @@ def get_int_env(name: str, default: int) -> int:
         return default
 
 
-def get_collection_config() -> dict:
-    """Centralized config for news collection parameters (env-overridable)."""
-    return {
-        # NewsAPI
-        'news_pages': get_int_env('NEWS_PAGES', 3),
-        'news_page_size': get_int_env('NEWS_PAGE_SIZE', 25),
-        'news_days': get_int_env('NEWS_DAYS', 2),
+@dataclass(frozen=True, slots=True)
+class CollectionConfig:
+    """News collection parameters, read from the environment once."""
+
+    # NewsAPI
+    news_pages: int
+    news_page_size: int
+    news_days: int
+
+    # Tavily
+    tavily_max_results: int
+    tavily_days: int
+
+    # Google Custom Search
+    cse_pages: int
+    cse_num: int
 
-        # Tavily
-        'tavily_max_results': get_int_env('TAVILY_MAX_RESULTS', 15),
-        'tavily_days': get_int_env('TAVILY_DAYS', 2),
+    def __getitem__(self, key: str) -> int:
+        # Keeps dict-style cfg['news_pages'] lookups working
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@lru_cache(maxsize=1)
+def get_collection_config() -> CollectionConfig:
+    """Centralized config for news collection parameters (env-overridable)."""
+    return CollectionConfig(
+        news_pages=get_int_env('NEWS_PAGES', 3),
+        news_page_size=get_int_env('NEWS_PAGE_SIZE', 25),
+        news_days=get_int_env('NEWS_DAYS', 2),
+        tavily_max_results=get_int_env('TAVILY_MAX_RESULTS', 15),
+        tavily_days=get_int_env('TAVILY_DAYS', 2),
+        cse_pages=get_int_env('CSE_PAGES', 2),
+        cse_num=get_int_env('CSE_NUM', 10),
+    )
 
-        # Google Custom Search
-        'cse_pages': get_int_env('CSE_PAGES', 2),
-        'cse_num': get_int_env('CSE_NUM', 10),
-    }
 
+def reset_collection_config() -> None:
+    """Drop the cached config so the next call re-reads the environment."""
+    get_collection_config.cache_clear()
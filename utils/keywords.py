@@ -1,8 +1,14 @@
 """
 Shared keywords for A-share relevance filtering.
 """
+from functools import lru_cache
 
-A_SHARE_KEYWORDS = [
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional C extension; substring scan is the fallback
+    ahocorasick = None
+
+A_SHARE_KEYWORDS = (
     "semiconductor export ban", "EV subsidy China", "China tech policy", "A-share market",
     "Shanghai Composite", "Shenzhen Component", "Chinese economy", "Beijing policy",
     "Made in China 2025", "Belt and Road Initiative", "Chinese manufacturing",
@@ -17,5 +23,19 @@ A_SHARE_KEYWORDS = [
     "ipo", "earnings", "revenue", "profit", "valuation", "pe ratio", "dividend",
     "market cap", "bull market", "bear market", "correction", "recession", "inflation",
     "interest rates", "fed rate", "monetary policy", "fiscal policy", "gdp", "unemployment"
-]
+)
+
 
+@lru_cache(maxsize=1)
+def a_share_automaton():
+    """
+    Aho-Corasick automaton over the lowercased A-share keywords (value = keyword),
+    built on first use and shared by every caller; None without pyahocorasick.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in dict.fromkeys(kw.lower() for kw in A_SHARE_KEYWORDS):
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
@@ -1,26 +1,34 @@
 import re
 
 
-def redact_secrets(text: str) -> str:
-    """Redact common secret patterns from logs and error strings."""
-    if not isinstance(text, str):
-        return text
-
-    redacted = text
+# One alternation, so the text is scanned once; branches are tried in order at each position.
+# A URL's ?key=... params are covered by the generic kv branch, so they need no pattern of their own.
+# A bearer token ending in a key name ("Bearer token=abc") also takes the kv value with it.
+_BEARER_TOKEN = r"Bearer\s+[A-Za-z0-9._\-]+(?:(?:(?<=key)|(?<=token)|(?<=secret))(?P<{}>=[^&\s]+))?"
+_SECRETS_RE = re.compile(
+    r"(?P<auth>Authorization:\s*" + _BEARER_TOKEN.format("auth_value") + ")"  # Authorization: Bearer <token>
+    r"|(?P<bearer>" + _BEARER_TOKEN.format("bearer_value") + ")"  # bearer tokens without header prefix
+    r"|(?P<kv>(?:api[_-]?key|key|token|secret)=[^&\s]+)",  # apiKey=, api_key=, key=, token=, secret=
+    re.I,
+)
 
-    # Query params like apiKey=, apikey=, api_key=, key=, token=, secret=
-    redacted = re.sub(r"(?i)(api[_-]?key|key|token|secret)=([^&\s]+)", r"\1=***REDACTED***", redacted)
+_REDACTED = "***REDACTED***"
+_REPLACERS = {
+    "auth": lambda m: "Authorization: Bearer " + _REDACTED + ("=" + _REDACTED if m.group("auth_value") else ""),
+    "bearer": lambda m: "Bearer " + _REDACTED + ("=" + _REDACTED if m.group("bearer_value") else ""),
+    "kv": lambda m: m.group("kv").partition("=")[0] + "=" + _REDACTED,
+}
 
-    # Authorization: Bearer <token>
-    redacted = re.sub(r"(?i)Authorization:\s*Bearer\s+[A-Za-z0-9._\-]+", "Authorization: Bearer ***REDACTED***", redacted)
 
-    # Generic bearer tokens without header prefix
-    redacted = re.sub(r"(?i)Bearer\s+[A-Za-z0-9._\-]+", "Bearer ***REDACTED***", redacted)
+def _redact_match(match: re.Match) -> str:
+    return _REPLACERS[match.lastgroup](match)
 
-    # URLs that include secrets (best-effort)
-    redacted = re.sub(r"(?i)(https?://[^\s?]+\?(?:[^\s]*))(api[_-]?key|key|token|secret)=([^&\s]+)", r"\1\2=***REDACTED***", redacted)
 
-    return redacted
+def redact_secrets(text: str) -> str:
+    """Redact common secret patterns from logs and error strings."""
+    if not isinstance(text, str):
+        return text
+    return _SECRETS_RE.sub(_redact_match, text)
 
 
 def is_configured_key(value: str) -> bool: